@@ -1,6 +1,6 @@
+import logging
 import os
 import sys
-import configparser
 from logging.config import fileConfig
 from dotenv import load_dotenv
 
@@ -9,7 +9,7 @@ backend_dir = os.path.dirname(os.path.dirname(__file__))
 load_dotenv(os.path.join(backend_dir, '.env'))
 
 from sqlalchemy import pool
-from sqlalchemy.engine import Connection
+from sqlalchemy.engine import Connection, make_url
 from sqlalchemy.ext.asyncio import async_engine_from_config
 
 from alembic import context
@@ -29,9 +29,11 @@ from app.models.resume import Resume, ParsedResumeData, ResumeCorrection, Resume
 config = context.config
 
 # Interpret the config file for Python logging.
-# This line sets up loggers basically.
-if config.config_file_name is not None:
-    fileConfig(config.config_file_name)
+# Alembic re-executes env.py on every run, so only install the ini handlers
+# when nothing has configured logging yet (first CLI run, not a warm process
+# that already has handlers), and never detach the app's existing loggers.
+if config.config_file_name is not None and not logging.getLogger().handlers:
+    fileConfig(config.config_file_name, disable_existing_loggers=False)
 
 # Get DATABASE_URL from environment, fallback to config file
 database_url = os.getenv("DATABASE_URL", config.get_main_option("sqlalchemy.url"))
@@ -39,27 +41,15 @@ database_url = os.getenv("DATABASE_URL", config.get_main_option("sqlalchemy.url"
 # For Alembic migrations, we need to convert asyncpg to psycopg for synchronous migrations
 # Alembic doesn't support async migrations directly
 # Note: psycopg 3.x uses 'postgresql+psycopg://' URL
-if database_url.startswith("postgresql+asyncpg://"):
-    # Convert to psycopg 3.x format for sync migrations
-    database_url_sync = database_url.replace("postgresql+asyncpg://", "postgresql+psycopg://", 1)
-elif database_url.startswith("postgresql://"):
-    # Plain postgresql:// URL, convert to use psycopg
-    database_url_sync = database_url.replace("postgresql://", "postgresql+psycopg://", 1)
-else:
-    database_url_sync = database_url
-
-# IMPORTANT: Don't set this back to config if it has special characters
-# ConfigParser fails on URL-encoded passwords with % and { }
-# Instead, we'll pass it directly to the engine
-try:
-    config.set_main_option("sqlalchemy.url", database_url_sync)
-except (ValueError, configparser.InterpolationError) as e:
-    # If ConfigParser fails (special characters in password), skip setting it
-    # The engine will use the URL directly from environment variable
-    import warnings
-    warnings.warn(f"Could not set URL in alembic.ini due to special characters: {e}")
-    # Store in environment for run_migrations_online() to use
-    os.environ["ALEMBIC_DATABASE_URL"] = database_url_sync
+url = make_url(database_url)
+if url.drivername in ("postgresql", "postgresql+asyncpg"):
+    url = url.set(drivername="postgresql+psycopg")
+database_url_sync = url.render_as_string(hide_password=False)
+
+# ConfigParser treats "%" as an interpolation marker, which breaks on
+# URL-encoded passwords. Escape it so set_main_option always succeeds;
+# get_main_option/get_section un-escape it transparently.
+config.set_main_option("sqlalchemy.url", database_url_sync.replace("%", "%%"))
 
 # add your model's MetaData object here
 # for 'autogenerate' support
@@ -116,20 +106,11 @@ def run_migrations_online() -> None:
     # Synchronous engine for Alembic migrations
     from sqlalchemy import engine_from_config
 
-    # Check if we have a fallback URL from environment (ConfigParser failed)
-    fallback_url = os.environ.get("ALEMBIC_DATABASE_URL")
-
-    if fallback_url:
-        # Create engine directly from URL (bypasses config.get_section)
-        from sqlalchemy import create_engine
-        connectable = create_engine(fallback_url, poolclass=pool.NullPool)
-    else:
-        # Use standard config-based engine creation
-        connectable = engine_from_config(
-            config.get_section(config.config_ini_section, {}),
-            prefix="sqlalchemy.",
-            poolclass=pool.NullPool,
-        )
+    connectable = engine_from_config(
+        config.get_section(config.config_ini_section, {}),
+        prefix="sqlalchemy.",
+        poolclass=pool.NullPool,
+    )
 
     with connectable.connect() as connection:
         do_run_migrations(connection)
@@ -0,0 +1,26 @@
+"""Drop redundant file_hash index
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '002'
+down_revision: Union[str, None] = '001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # UniqueConstraint('file_hash') already maintains a unique btree index,
+    # so the extra non-unique index only doubles the write cost per INSERT
+    op.drop_index(op.f('ix_resumes_file_hash'), table_name='resumes')
+
+
+def downgrade() -> None:
+    op.create_index(op.f('ix_resumes_file_hash'), 'resumes', ['file_hash'])
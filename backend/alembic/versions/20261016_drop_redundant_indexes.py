@@ -0,0 +1,40 @@
+"""Drop indexes duplicated by primary key and unique constraints
+
+Revision ID: 004
+Revises: 002
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '004'
+down_revision: Union[str, None] = '002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (index name, table, columns) for indexes that duplicate the unique btree
+# PostgreSQL already builds for a PRIMARY KEY or UNIQUE constraint
+REDUNDANT_INDEXES = [
+    ('ix_resumes_id', 'resumes', ['id']),
+    ('ix_parsed_resume_data_id', 'parsed_resume_data', ['id']),
+    ('ix_resume_corrections_id', 'resume_corrections', ['id']),
+    ('ix_resume_shares_id', 'resume_shares', ['id']),
+    ('ix_resume_shares_share_token', 'resume_shares', ['share_token']),
+]
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction, and avoids locking
+    # the tables against writes while the indexes are dropped
+    with op.get_context().autocommit_block():
+        for name, table, _ in REDUNDANT_INDEXES:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns in reversed(REDUNDANT_INDEXES):
+            op.create_index(name, table, columns, postgresql_concurrently=True)
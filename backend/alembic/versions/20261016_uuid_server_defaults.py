@@ -0,0 +1,45 @@
+"""Generate child-table UUID primary keys in PostgreSQL
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '005'
+down_revision: Union[str, None] = '004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# resumes.id stays application-generated (time-ordered UUIDv7): the upload
+# endpoint needs the ID before the INSERT to build the WebSocket URL
+TABLES = ['parsed_resume_data', 'resume_corrections', 'resume_shares']
+
+
+def upgrade() -> None:
+    # gen_random_uuid() is built into PostgreSQL 13+, no pgcrypto required
+    for table in TABLES:
+        op.alter_column(
+            table,
+            'id',
+            server_default=sa.text('gen_random_uuid()'),
+            existing_type=postgresql.UUID(),
+            existing_nullable=False,
+        )
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.alter_column(
+            table,
+            'id',
+            server_default=None,
+            existing_type=postgresql.UUID(),
+            existing_nullable=False,
+        )
@@ -5,18 +5,25 @@ This file wraps the FastAPI application with Mangum to work
 with Vercel's serverless functions.
 """
 
+import asyncio
 import sys
 from pathlib import Path
 
+import uvloop
+from mangum import Mangum
+
 # Add backend directory to Python path for imports
 # When deploying from monorepo root, api/index.py needs to find app.main
 backend_dir = Path(__file__).parent.parent
 if str(backend_dir) not in sys.path:
     sys.path.insert(0, str(backend_dir))
 
-from mangum import Mangum
 from app.main import app
 
+# Mangum drives the ASGI app on asyncio's default loop; switch it to the
+# libuv-backed uvloop (shipped with uvicorn[standard]) for faster dispatch
+asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
 # Vercel requires a module-level 'handler' variable
 # This wraps the FastAPI ASGI app for AWS Lambda compatibility
 handler = Mangum(app, lifespan="off")
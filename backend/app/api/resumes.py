@@ -6,51 +6,92 @@ The main endpoint is POST /v1/resumes/upload which accepts resume files
 in PDF, DOCX, DOC, or TXT format.
 """
 
-from fastapi import APIRouter, File, UploadFile, HTTPException, BackgroundTasks
-from typing import Dict, Optional
+from fastapi import APIRouter, File, UploadFile, HTTPException, BackgroundTasks, Request, Response
+from fastapi.responses import ORJSONResponse
+from starlette.concurrency import run_in_threadpool
+from typing import BinaryIO, Dict, Optional
 from pydantic import BaseModel
 import hashlib
-import uuid
 import asyncio
+import contextlib
+import json
+import logging
+import msgspec
+import os
+import tempfile
 
 from app.api.websocket import manager
-from app.services.parser_orchestrator import ParserOrchestrator
+from app.services.parser_orchestrator import ParserOrchestrator, wait_for_parsed_data
+from app.services.parse_queue import ParseQueue
 from app.core.storage import get_parsed_resume, update_parsed_resume
+from app.core.cache import invalidate_parsed_resume
 from app.core.database import get_db
+from app.core.ids import uuid7
 from app.services.storage_adapter import StorageAdapter
 
+logger = logging.getLogger(__name__)
+
 # File type validation constants
-ALLOWED_EXTENSIONS = {"pdf", "docx", "doc", "txt"}
-ALLOWED_MIME_TYPES = {
+# Each accepted MIME type maps to the extension it must arrive with, so a
+# single dict lookup validates both the MIME type and the extension
+MIME_TYPE_EXTENSIONS = {
     # PDF formats
-    "application/pdf",
+    "application/pdf": "pdf",
     # DOCX format
-    "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+    "application/vnd.openxmlformats-officedocument.wordprocessingml.document": "docx",
     # Legacy DOC format
-    "application/msword",
+    "application/msword": "doc",
     # Text format
-    "text/plain",
+    "text/plain": "txt",
 }
+ALLOWED_EXTENSIONS = frozenset(MIME_TYPE_EXTENSIONS.values())
+ALLOWED_MIME_TYPES = frozenset(MIME_TYPE_EXTENSIONS)
+
+# Precomputed so the rejection path doesn't re-sort on every request
+_ALLOWED_EXTENSIONS_STR = ", ".join(sorted(ALLOWED_EXTENSIONS))
 
 # Maximum file size: 10MB
 MAX_FILE_SIZE = 10 * 1024 * 1024
 
-# Create router with prefix and tags
-router = APIRouter(prefix="/v1/resumes", tags=["resumes"])
+# Read uploads in 64KB chunks so hashing stays cache-resident
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+# Oversized uploads are the cheapest thing to spam, so their 400 body is
+# serialized once at import instead of going through HTTPException handling
+_FILE_TOO_LARGE_BODY = json.dumps(
+    {"detail": f"File too large. Maximum size: {MAX_FILE_SIZE // (1024 * 1024)}MB"}
+).encode()
+
+# Create router with prefix and tags; responses are serialized with orjson
+router = APIRouter(
+    prefix="/v1/resumes", tags=["resumes"], default_response_class=ORJSONResponse
+)
 
 # Create orchestrator instance for background parsing
 orchestrator = ParserOrchestrator(manager)
 
 
-# Pydantic models for request/response
-class ResumeUpdateRequest(BaseModel):
-    """Request model for updating parsed resume data"""
+# Request/response models
+class ResumeUpdateRequest(msgspec.Struct):
+    """
+    Request model for updating parsed resume data.
+
+    A msgspec Struct rather than a Pydantic model: update bodies carry
+    whole work_experience/education lists, and msgspec decodes and
+    type-checks them in one pass straight from the raw JSON.
+    """
     personal_info: Optional[dict] = None
     work_experience: Optional[list] = None
     education: Optional[list] = None
     skills: Optional[dict] = None
 
 
+# OpenAPI schema for the update body, since FastAPI doesn't parse it
+_RESUME_UPDATE_SCHEMA = msgspec.json.schema_components([ResumeUpdateRequest])[1][
+    "ResumeUpdateRequest"
+]
+
+
 class ResumeResponse(BaseModel):
     """Response model for resume data"""
     resume_id: str
@@ -59,6 +100,34 @@ class ResumeResponse(BaseModel):
     message: Optional[str] = None
 
 
+def _resume_response(
+    resume_id: str,
+    status: str,
+    data: Optional[dict],
+    message: Optional[str] = None
+) -> ORJSONResponse:
+    """
+    Build a ResumeResponse without validating the parsed data.
+
+    The data comes from our own parser/storage, so validation is skipped
+    via model_construct, and returning a Response directly also skips
+    FastAPI's response_model re-validation.
+
+    Args:
+        resume_id: Unique identifier for the resume
+        status: Resume status to report
+        data: Parsed resume data
+        message: Optional message for the client
+
+    Returns:
+        ORJSONResponse with the serialized ResumeResponse
+    """
+    response = ResumeResponse.model_construct(
+        resume_id=resume_id, status=status, data=data, message=message
+    )
+    return ORJSONResponse(content=response.model_dump())
+
+
 def _validate_file_type(filename: str, content_type: str) -> tuple[bool, str | None]:
     """
     Validate file type by extension and MIME type.
@@ -73,23 +142,81 @@ def _validate_file_type(filename: str, content_type: str) -> tuple[bool, str | N
     if not filename:
         return False, "No filename provided"
 
+    file_extension = filename.rpartition(".")[2].lower()
+    expected_extension = MIME_TYPE_EXTENSIONS.get(content_type)
+
+    # Happy path: known MIME type whose extension matches. Some clients
+    # label .docx files with the legacy Word MIME type, so allow that pair.
+    if file_extension == expected_extension or (
+        expected_extension == "doc" and file_extension == "docx"
+    ):
+        return True, None
+
     # Check file extension
-    file_extension = filename.split(".")[-1].lower()
     if file_extension not in ALLOWED_EXTENSIONS:
-        allowed = ", ".join(sorted(ALLOWED_EXTENSIONS))
-        return False, f"Unsupported file type. Allowed: {allowed}"
+        return False, f"Unsupported file type. Allowed: {_ALLOWED_EXTENSIONS_STR}"
 
     # Check MIME type (more reliable than extension)
-    if content_type not in ALLOWED_MIME_TYPES:
+    if expected_extension is None:
         return False, f"Unsupported MIME type: {content_type}"
 
-    return True, None
+    return False, f"File extension .{file_extension} does not match MIME type {content_type}"
+
+
+def _read_and_hash(f: BinaryIO, limit: int) -> tuple[str | None, str, int]:
+    """
+    Read an upload in chunks, hashing, size-checking and spooling it to disk.
+
+    Runs synchronously against the underlying spooled file so the whole
+    read costs a single threadpool hand-off instead of one per chunk.
+    The content is written to a temporary file rather than kept in
+    memory, so uploads waiting in the parse queue don't pin their bytes.
+
+    Args:
+        f: The raw file object behind the UploadFile
+        limit: Maximum allowed size in bytes
+
+    Returns:
+        tuple: (spool_path, sha256_hexdigest, size); spool_path is None if
+               the file exceeds the limit, in which case reading stops early
+               and nothing is left on disk
+    """
+    hasher = hashlib.sha256()
+    size = 0
+    with tempfile.NamedTemporaryFile(prefix="resume-", delete=False) as spool:
+        while chunk := f.read(UPLOAD_CHUNK_SIZE):
+            size += len(chunk)
+            if size > limit:
+                break
+            hasher.update(chunk)
+            spool.write(chunk)
+    if size > limit:
+        os.unlink(spool.name)
+        return None, "", size
+    return spool.name, hasher.hexdigest(), size
+
+
+def _read_spooled_upload(spool_path: str) -> bytes:
+    """
+    Read a spooled upload back into memory and delete it from disk.
+
+    Args:
+        spool_path: Path returned by _read_and_hash
+
+    Returns:
+        bytes: The uploaded file content
+    """
+    try:
+        with open(spool_path, "rb") as f:
+            return f.read()
+    finally:
+        os.unlink(spool_path)
 
 
 async def parse_resume_background(
     resume_id: str,
     filename: str,
-    content: bytes,
+    spool_path: str,
     file_hash: str,
     file_size: int,
     file_type: str
@@ -104,7 +231,7 @@ async def parse_resume_background(
     Args:
         resume_id: Unique identifier for this resume
         filename: Original filename of the uploaded file
-        content: Raw file content as bytes
+        spool_path: Temporary file holding the upload; deleted once read
         file_hash: SHA256 hash of file content
         file_size: File size in bytes
         file_type: File extension (pdf, docx, doc, txt)
@@ -114,6 +241,7 @@ async def parse_resume_background(
         failures from affecting the HTTP response.
     """
     try:
+        content = await run_in_threadpool(_read_spooled_upload, spool_path)
         await orchestrator.parse_resume(
             resume_id,
             filename,
@@ -124,7 +252,12 @@ async def parse_resume_background(
         )
     except Exception as e:
         # Log error but don't raise - background task should not fail visibly
-        print(f"Background parsing error for {resume_id}: {e}")
+        logger.error(f"Background parsing error for {resume_id}: {e}", exc_info=True)
+
+
+# Bounded worker pool that runs parse jobs; caps concurrent parsing under
+# upload bursts instead of starting one unbounded task per request
+parse_queue = ParseQueue(parse_resume_background)
 
 
 @router.post("/upload", status_code=202)
@@ -150,10 +283,12 @@ async def upload_resume(
 
     Raises:
         HTTPException: 400 if file type or size validation fails
+        HTTPException: 503 if the parse queue is full
     """
     from app.core.database import db_manager
     from app.models.resume import Resume
     from sqlalchemy import select
+    from sqlalchemy.dialects.postgresql import insert as pg_insert
 
     # Validate file type
     is_valid, error_message = _validate_file_type(file.filename, file.content_type)
@@ -163,94 +298,126 @@ async def upload_resume(
             detail=error_message
         )
 
-    # Read file content for validation and hashing
-    content = await file.read()
+    # Reject oversized uploads from their known size without reading them;
+    # the chunked read below still enforces the limit if the size is unknown
+    if file.size is not None and file.size > MAX_FILE_SIZE:
+        return Response(
+            content=_FILE_TOO_LARGE_BODY,
+            status_code=400,
+            media_type="application/json",
+        )
 
-    # Validate file size
-    if len(content) > MAX_FILE_SIZE:
-        max_size_mb = MAX_FILE_SIZE / (1024 * 1024)
+    # Apply backpressure before doing any work for this upload
+    if parse_queue.full():
         raise HTTPException(
-            status_code=400,
-            detail=f"File too large. Maximum size: {max_size_mb:.0f}MB"
+            status_code=503,
+            detail="Too many resumes are being processed. Please try again shortly."
         )
 
-    # Generate unique resume ID
-    resume_id = str(uuid.uuid4())
+    # Read, hash and size-check the spooled file in one worker thread so
+    # oversized files are rejected before they are fully buffered
+    spool_path, file_hash, file_size = await run_in_threadpool(
+        _read_and_hash, file.file, MAX_FILE_SIZE
+    )
 
-    # Generate SHA256 hash of file content for deduplication
-    file_hash = hashlib.sha256(content).hexdigest()
+    # Validate file size
+    if spool_path is None:
+        return Response(
+            content=_FILE_TOO_LARGE_BODY,
+            status_code=400,
+            media_type="application/json",
+        )
+
+    # Generate unique, time-ordered resume ID (keeps the PK index append-only)
+    resume_id = str(uuid7())
 
     # Extract file extension for file_type field
-    file_extension = file.filename.split(".")[-1].lower() if file.filename else "unknown"
+    file_extension = file.filename.rpartition(".")[2].lower() if file.filename else "unknown"
 
     # Save resume metadata to database BEFORE starting background task
     # This ensures the resume record exists when the background task tries to update it
     from app.core.config import settings
 
     if settings.USE_DATABASE:
-        async with db_manager.get_session() as db:
-            # Check for duplicate file hash
-            existing = await db.execute(
-                select(Resume).where(Resume.file_hash == file_hash)
-            )
-            existing_resume = existing.scalar_one_or_none()
-
-            if existing_resume:
-                # Check if existing resume has been processed
-                from app.services.storage_adapter import StorageAdapter
-                adapter = StorageAdapter(db)
-                existing_data = await adapter.get_parsed_data(str(existing_resume.id))
-
-                # Return existing resume info instead of error
-                return {
-                    "resume_id": str(existing_resume.id),
-                    "status": "already_processed" if existing_resume.processing_status == "complete" else "processing",
-                    "message": "This file was already uploaded",
-                    "file_hash": file_hash,
-                    "original_filename": existing_resume.original_filename,
-                    "uploaded_at": existing_resume.uploaded_at.isoformat() if existing_resume.uploaded_at else None,
-                    "processed_at": existing_resume.processed_at.isoformat() if existing_resume.processed_at else None,
-                    "websocket_url": f"/ws/resumes/{existing_resume.id}",
-                    "has_parsed_data": existing_data is not None,
-                    # If complete, include the parsed data for immediate display
-                    "existing_data": existing_data if existing_data else None
-                }
-
-            # Create resume metadata record
-            resume = Resume(
-                id=resume_id,
-                original_filename=file.filename,
-                file_type=file_extension,
-                file_size_bytes=len(content),
-                file_hash=file_hash,
-                storage_path="",  # Will implement file storage later
-                processing_status="processing"
-            )
-            db.add(resume)
-            await db.commit()
-
-    # Start background parsing task with metadata parameters
-    # BackgroundTasks is preferred for production
+        try:
+            async with db_manager.get_session() as db:
+                # Insert the metadata record, letting the file_hash unique
+                # constraint detect duplicates in the same round-trip
+                result = await db.execute(
+                    pg_insert(Resume)
+                    .values(
+                        id=resume_id,
+                        original_filename=file.filename,
+                        file_type=file_extension,
+                        file_size_bytes=file_size,
+                        file_hash=file_hash,
+                        storage_path="",  # Will implement file storage later
+                        processing_status="processing"
+                    )
+                    .on_conflict_do_nothing(index_elements=[Resume.file_hash])
+                    .returning(Resume.id)
+                )
+                inserted_id = result.scalar_one_or_none()
+                await db.commit()
+
+                if inserted_id is None:
+                    # Duplicate file hash: load the existing resume
+                    existing = await db.execute(
+                        select(Resume).where(Resume.file_hash == file_hash)
+                    )
+                    existing_resume = existing.scalar_one()
+
+                    # Check if existing resume has been processed
+                    adapter = StorageAdapter(db)
+                    existing_data = await adapter.get_parsed_data(str(existing_resume.id))
+
+                    # Nothing will be parsed, so drop the spooled copy
+                    os.unlink(spool_path)
+
+                    # Return existing resume info instead of error
+                    return {
+                        "resume_id": str(existing_resume.id),
+                        "status": "already_processed" if existing_resume.processing_status == "complete" else "processing",
+                        "message": "This file was already uploaded",
+                        "file_hash": file_hash,
+                        "original_filename": existing_resume.original_filename,
+                        "uploaded_at": existing_resume.uploaded_at.isoformat() if existing_resume.uploaded_at else None,
+                        "processed_at": existing_resume.processed_at.isoformat() if existing_resume.processed_at else None,
+                        "websocket_url": f"/ws/resumes/{existing_resume.id}",
+                        "has_parsed_data": existing_data is not None,
+                        # If complete, include the parsed data for immediate display
+                        "existing_data": existing_data if existing_data else None
+                    }
+        except Exception:
+            # The upload won't be queued, so don't leave its spool behind;
+            # the duplicate branch may already have removed it
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(spool_path)
+            raise
+
+    # Queue background parsing with metadata parameters
+    # BackgroundTasks is preferred for production; it waits for the queued
+    # job so serverless invocations stay alive until parsing finishes
     if background_tasks:
         background_tasks.add_task(
-            parse_resume_background,
+            parse_queue.run,
             resume_id,
             file.filename,
-            content,
+            spool_path,
             file_hash,
-            len(content),
+            file_size,
             file_extension
         )
     else:
         # For testing without BackgroundTasks, use asyncio.create_task
         # Note: In tests using TestClient, explicit task handling may be needed
         asyncio.create_task(
-            parse_resume_background(
+            parse_queue.run(
                 resume_id,
                 file.filename,
-                content,
+                spool_path,
                 file_hash,
-                len(content),
+                file_size,
                 file_extension
             )
         )
@@ -266,7 +433,7 @@ async def upload_resume(
 
 
 @router.get("/{resume_id}", response_model=ResumeResponse)
-async def get_resume(resume_id: str) -> ResumeResponse:
+async def get_resume(resume_id: str) -> ORJSONResponse:
     """
     Retrieve parsed resume data by ID.
 
@@ -279,7 +446,6 @@ async def get_resume(resume_id: str) -> ResumeResponse:
     Raises:
         HTTPException: 404 if resume not found, 202 if still processing
     """
-    import asyncio
     from app.core.config import settings
     from app.core.database import db_manager
     from app.models.resume import Resume
@@ -312,27 +478,20 @@ async def get_resume(resume_id: str) -> ResumeResponse:
             parsed_data = await adapter.get_parsed_data(resume_id)
 
             # Handle race condition: Resume marked complete but data not yet committed
-            # Retry up to 3 times with 100ms delay between retries
+            # Wait (up to 300ms) for the parser to signal the commit, then re-read once
             if parsed_data is None:
-                for attempt in range(3):
-                    await asyncio.sleep(0.1)  # Wait 100ms
-                    await db.rollback()  # Clear any transaction state
-                    parsed_data = await adapter.get_parsed_data(resume_id)
-                    if parsed_data is not None:
-                        break
+                await wait_for_parsed_data(resume_id, timeout=0.3)
+                await db.rollback()  # Clear any transaction state
+                parsed_data = await adapter.get_parsed_data(resume_id)
 
             if parsed_data is None:
-                # Data still not available after retries
+                # Data still not available after waiting
                 raise HTTPException(
                     status_code=404,
                     detail=f"Resume {resume_id} not found or still processing"
                 )
 
-            return ResumeResponse(
-                resume_id=resume_id,
-                status="complete",
-                data=parsed_data
-            )
+            return _resume_response(resume_id, "complete", parsed_data)
     else:
         # In-memory storage path
         parsed_data = get_parsed_resume(resume_id)
@@ -343,64 +502,83 @@ async def get_resume(resume_id: str) -> ResumeResponse:
                 detail=f"Resume {resume_id} not found or still processing"
             )
 
-        return ResumeResponse(
-            resume_id=resume_id,
-            status="complete",
-            data=parsed_data
+        return _resume_response(resume_id, "complete", parsed_data)
+
+
+def _raise_if_missing(resume_id: str, current_data: Optional[dict]) -> None:
+    """Raise 404 if no parsed data exists for the resume."""
+    if current_data is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Resume {resume_id} not found"
         )
 
 
-@router.put("/{resume_id}", response_model=ResumeResponse)
-async def update_resume(
-    resume_id: str,
-    update_data: ResumeUpdateRequest
-) -> ResumeResponse:
+def _apply_resume_update(current_data: dict, update_data: ResumeUpdateRequest) -> None:
+    """
+    Apply user corrections to parsed resume data in place.
+
+    Args:
+        current_data: The stored parsed resume data
+        update_data: Updated resume data fields; only provided fields change
+    """
+    # Decoded fields are plain dicts/lists, so they can be merged or
+    # stored as-is without copying
+    if (personal_info := update_data.personal_info) is not None:
+        current_data["personal_info"] |= personal_info
+    if (work_experience := update_data.work_experience) is not None:
+        current_data["work_experience"] = work_experience
+    if (education := update_data.education) is not None:
+        current_data["education"] = education
+    if (skills := update_data.skills) is not None:
+        current_data["skills"] |= skills
+
+
+@router.put(
+    "/{resume_id}",
+    response_model=ResumeResponse,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": _RESUME_UPDATE_SCHEMA}},
+        }
+    },
+)
+async def update_resume(resume_id: str, request: Request) -> ORJSONResponse:
     """
     Update parsed resume data with user corrections.
 
     Args:
         resume_id: Unique identifier for the resume
-        update_data: Updated resume data fields
+        request: Request whose JSON body is a ResumeUpdateRequest
 
     Returns:
         ResumeResponse with updated data
 
     Raises:
+        HTTPException: 422 if the body is not a valid ResumeUpdateRequest
         HTTPException: 404 if resume not found
     """
     from app.core.config import settings
     from app.core.database import db_manager
 
-    # Get current data
-    if settings.USE_DATABASE:
-        async with db_manager.get_session() as db:
-            adapter = StorageAdapter(db)
-            current_data = await adapter.get_parsed_data(resume_id)
-    else:
-        current_data = get_parsed_resume(resume_id)
-
-    if current_data is None:
-        raise HTTPException(
-            status_code=404,
-            detail=f"Resume {resume_id} not found"
-        )
+    try:
+        update_data = msgspec.json.decode(await request.body(), type=ResumeUpdateRequest)
+    except msgspec.DecodeError as e:
+        raise HTTPException(status_code=422, detail=str(e))
 
-    # Update only provided fields
-    if update_data.personal_info is not None:
-        current_data["personal_info"].update(update_data.personal_info)
-    if update_data.work_experience is not None:
-        current_data["work_experience"] = update_data.work_experience
-    if update_data.education is not None:
-        current_data["education"] = update_data.education
-    if update_data.skills is not None:
-        current_data["skills"].update(update_data.skills)
-
-    # Save updated data
+    # Read, apply and write the update within a single session
     if settings.USE_DATABASE:
         async with db_manager.get_session() as db:
             adapter = StorageAdapter(db)
+            current_data = await adapter.get_parsed_data(resume_id)
+            _raise_if_missing(resume_id, current_data)
+            _apply_resume_update(current_data, update_data)
             update_success = await adapter.update_parsed_data(resume_id, current_data)
     else:
+        current_data = get_parsed_resume(resume_id)
+        _raise_if_missing(resume_id, current_data)
+        _apply_resume_update(current_data, update_data)
         update_success = update_parsed_resume(resume_id, current_data)
 
     if not update_success:
@@ -409,9 +587,9 @@ async def update_resume(
             detail="Failed to update resume data"
         )
 
-    return ResumeResponse(
-        resume_id=resume_id,
-        status="updated",
-        data=current_data,
-        message="Resume updated successfully"
+    # Shared/exported views must not serve the pre-edit data
+    invalidate_parsed_resume(resume_id)
+
+    return _resume_response(
+        resume_id, "updated", current_data, message="Resume updated successfully"
     )
@@ -9,9 +9,11 @@ This module provides endpoints for managing resume share links, including:
 - Export functionality (PDF, WhatsApp, Telegram, Email)
 """
 
-from fastapi import APIRouter, HTTPException, Response, Depends
-from fastapi.responses import Response as FastAPIResponse
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Request, Response, Depends
+from fastapi.responses import ORJSONResponse, Response as FastAPIResponse
 from typing import Dict, Optional
+import hashlib
+import time
 from pydantic import BaseModel
 
 # Import both storage implementations
@@ -20,22 +22,32 @@ from app.core.share_storage import (
     get_share as get_share_inmemory,
     increment_access as increment_access_inmemory,
     revoke_share as revoke_share_inmemory,
-    is_share_valid as is_share_valid_inmemory,
+    get_share_token_by_resume_id as get_share_token_by_resume_id_inmemory,
+    get_share_by_resume_id as get_share_by_resume_id_inmemory,
 )
 from app.services.database_share_storage import (
     create_share as create_share_db,
-    get_share as get_share_db,
-    increment_access as increment_access_db,
-    revoke_share as revoke_share_db,
-    is_share_valid as is_share_valid_db,
     get_share_token_by_resume_id as get_share_token_by_resume_id_db,
+    get_share_by_resume_id as get_share_by_resume_id_db,
+    revoke_share_by_resume_id as revoke_share_by_resume_id_db,
+    get_share_with_parsed_resume as get_share_with_parsed_resume_db,
 )
 from app.core.storage import get_parsed_resume as get_parsed_resume_inmemory
 from app.services.storage_adapter import StorageAdapter
+from app.core.cache import (
+    cache_parsed_resume,
+    cache_share,
+    cache_share_response,
+    get_cached_parsed_resume,
+    get_cached_share,
+    get_cached_share_response,
+    invalidate_share,
+)
+from app.services.access_counter import access_counter
 from app.core.config import settings
 from app.core.database import get_db
+from app.services.pdf_cache import content_key, get_or_render as get_or_render_pdf
 from app.services.export_service import (
-    generate_pdf,
     generate_whatsapp_link,
     generate_telegram_link,
     generate_email_link,
@@ -45,9 +57,22 @@ from app.services.export_service import (
 # Default base URL for share links if not configured
 DEFAULT_BASE_URL = "http://localhost:3000"
 
+# Public share responses may be reused by browsers and CDNs for a minute,
+# then served stale while the edge revalidates against the ETag
+SHARE_CACHE_CONTROL = "public, max-age=60, stale-while-revalidate=300"
+
+# Frontend base URL for share links, resolved once from the configured
+# origins instead of re-splitting ALLOWED_ORIGINS on every request
+_BASE_URL = (
+    settings.allowed_origins_list[0] if settings.allowed_origins_list else DEFAULT_BASE_URL
+)
+
+# Public share URLs are this prefix plus the share token
+_SHARE_PREFIX = _BASE_URL + "/shared/"
+
 
 # Create router with prefix and tags
-router = APIRouter(tags=["shares"])
+router = APIRouter(tags=["shares"], default_response_class=ORJSONResponse)
 
 
 # Storage abstraction layer
@@ -58,51 +83,113 @@ async def _create_share(resume_id: str, db=None):
     return create_share_inmemory(resume_id)
 
 
-async def _get_share(share_token: str, db=None):
-    """Get share using database or in-memory storage based on settings"""
-    if settings.USE_DATABASE and db:
-        return await get_share_db(share_token, db)
-    return get_share_inmemory(share_token)
-
-
-async def _increment_access(share_token: str, db=None):
+async def _increment_access(share_token: str, db=None, background_tasks=None):
     """Increment access using database or in-memory storage based on settings"""
     if settings.USE_DATABASE and db:
-        return await increment_access_db(share_token, db)
+        # Batch database writes; flush after the response once enough are pending
+        if access_counter.record(share_token) and background_tasks is not None:
+            background_tasks.add_task(access_counter.flush)
+        return True
     return increment_access_inmemory(share_token)
 
 
-async def _revoke_share(share_token: str, db=None):
-    """Revoke share using database or in-memory storage based on settings"""
-    if settings.USE_DATABASE and db:
-        return await revoke_share_db(share_token, db)
-    return revoke_share_inmemory(share_token)
+async def _get_public_share(share_token: str, db=None):
+    """
+    Get share metadata for public access, served from a short-TTL cache.
 
+    In database mode a cache miss fetches the share and its parsed resume
+    in one joined query and caches both, so the resume read that follows
+    is a cache hit.
+    """
+    share = get_cached_share(share_token)
+    if share is not None:
+        return share
 
-async def _is_share_valid(share_token: str, db=None):
-    """Check share validity using database or in-memory storage based on settings"""
     if settings.USE_DATABASE and db:
-        return await is_share_valid_db(share_token, db)
-    return is_share_valid_inmemory(share_token)
+        share, parsed_resume = await get_share_with_parsed_resume_db(share_token, db)
+        if share and parsed_resume is not None:
+            parsed_data = StorageAdapter.parsed_row_to_dict(parsed_resume)
+            cache_parsed_resume(share["resume_id"], parsed_data)
+    else:
+        share = get_share_inmemory(share_token)
+
+    if share:
+        cache_share(share_token, share)
+    return share
+
+
+def _is_share_dict_valid(share: dict) -> bool:
+    """
+    Check share metadata for validity (active and not expired).
+
+    Works on an already-fetched share so hot paths avoid a second lookup,
+    and compares the precomputed expiry epoch instead of parsing ISO strings.
+    """
+    return share["is_active"] and time.time() <= share["expires_at_epoch"]
 
 
 async def _get_share_token_by_resume_id(resume_id: str, db=None):
     """Get share token by resume ID using database or in-memory storage"""
     if settings.USE_DATABASE and db:
         return await get_share_token_by_resume_id_db(resume_id, db)
-    # In-memory implementation
-    from app.core.share_storage import _share_store
-    for token, metadata in _share_store.items():
-        if metadata.get("resume_id") == resume_id:
-            return token
-    return None
+    return get_share_token_by_resume_id_inmemory(resume_id)
+
+
+async def _get_share_by_resume_id(resume_id: str, db=None):
+    """Get a resume's active share using database or in-memory storage"""
+    if settings.USE_DATABASE and db:
+        return await get_share_by_resume_id_db(resume_id, db)
+    return get_share_by_resume_id_inmemory(resume_id)
+
+
+async def _revoke_share_by_resume_id(resume_id: str, db=None):
+    """Revoke a resume's active share; returns the revoked token or None"""
+    if settings.USE_DATABASE and db:
+        share_token = await revoke_share_by_resume_id_db(resume_id, db)
+    else:
+        share_token = get_share_token_by_resume_id_inmemory(resume_id)
+        if share_token and not revoke_share_inmemory(share_token):
+            share_token = None
+    if share_token:
+        invalidate_share(share_token)
+    return share_token
+
+
+def _body_etag(body: bytes) -> str:
+    """Strong ETag derived from a response body."""
+    return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """
+    Check whether the request's If-None-Match header matches an ETag.
+
+    Args:
+        request: The incoming request
+        etag: The quoted ETag of the current representation
+
+    Returns:
+        True if the client's cached copy is current
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    return any(
+        tag.strip().removeprefix("W/") in (etag, "*")
+        for tag in if_none_match.split(",")
+    )
 
 
 async def _get_parsed_resume(resume_id: str, db=None):
-    """Get parsed resume using database or in-memory storage"""
+    """Get parsed resume using database (through a TTL cache) or in-memory storage"""
     if settings.USE_DATABASE and db:
-        adapter = StorageAdapter(db)
-        return await adapter.get_parsed_data(resume_id)
+        parsed_data = get_cached_parsed_resume(resume_id)
+        if parsed_data is None:
+            adapter = StorageAdapter(db)
+            parsed_data = await adapter.get_parsed_data(resume_id)
+            if parsed_data is not None:
+                cache_parsed_resume(resume_id, parsed_data)
+        return parsed_data
     return get_parsed_resume_inmemory(resume_id)
 
 
@@ -165,7 +252,7 @@ async def create_resume_share(resume_id: str, db=Depends(get_db)) -> Dict:
     share_data = await _create_share(resume_id, db)
 
     # Construct share URL with /shared/ prefix for public access
-    share_url = f"{settings.allowed_origins_list[0]}/shared/{share_data['share_token']}"
+    share_url = _SHARE_PREFIX + share_data["share_token"]
 
     return {
         "share_token": share_data["share_token"],
@@ -192,25 +279,18 @@ async def get_resume_share(resume_id: str, db=Depends(get_db)) -> Dict:
     Raises:
         HTTPException: 404 if no share exists for this resume
     """
-    # Find the share token for this resume
-    share_token = await _get_share_token_by_resume_id(resume_id, db)
-
-    if not share_token:
-        raise HTTPException(
-            status_code=404,
-            detail=f"No share found for resume {resume_id}"
-        )
+    # Find the active share for this resume
+    share = await _get_share_by_resume_id(resume_id, db)
 
-    # Get share metadata
-    share = await _get_share(share_token, db)
     if not share:
         raise HTTPException(
             status_code=404,
-            detail=f"Share not found"
+            detail=f"No share found for resume {resume_id}"
         )
+    share_token = share["share_token"]
 
     # Construct share URL with /shared/ prefix for public access
-    share_url = f"{settings.allowed_origins_list[0]}/shared/{share['share_token']}"
+    share_url = _SHARE_PREFIX + share["share_token"]
 
     return {
         "share_token": share["share_token"],
@@ -218,7 +298,8 @@ async def get_resume_share(resume_id: str, db=Depends(get_db)) -> Dict:
         "resume_id": share["resume_id"],
         "created_at": share["created_at"],
         "expires_at": share["expires_at"],
-        "access_count": share["access_count"],
+        # Include views counted in this process but not yet flushed
+        "access_count": share["access_count"] + access_counter.pending(share_token),
         "is_active": share["is_active"]
     }
 
@@ -241,8 +322,8 @@ async def revoke_resume_share(resume_id: str, db=Depends(get_db)) -> Dict:
     Raises:
         HTTPException: 404 if no share exists for this resume
     """
-    # Find the share token for this resume
-    share_token = await _get_share_token_by_resume_id(resume_id, db)
+    # Revoke the active share for this resume
+    share_token = await _revoke_share_by_resume_id(resume_id, db)
 
     if not share_token:
         raise HTTPException(
@@ -250,15 +331,6 @@ async def revoke_resume_share(resume_id: str, db=Depends(get_db)) -> Dict:
             detail=f"No share found for resume {resume_id}"
         )
 
-    # Revoke the share
-    revoked = await _revoke_share(share_token, db)
-
-    if not revoked:
-        raise HTTPException(
-            status_code=404,
-            detail=f"Share not found"
-        )
-
     return {
         "message": "Share revoked successfully",
         "resume_id": resume_id
@@ -266,7 +338,12 @@ async def revoke_resume_share(resume_id: str, db=Depends(get_db)) -> Dict:
 
 
 @router.get("/v1/share/{share_token}", response_model=PublicShareResponse)
-async def get_public_share(share_token: str, db=Depends(get_db)) -> Dict:
+async def get_public_share(
+    share_token: str,
+    request: Request,
+    background_tasks: BackgroundTasks,
+    db=Depends(get_db)
+) -> Response:
     """
     Public endpoint to access a shared resume.
 
@@ -274,19 +351,22 @@ async def get_public_share(share_token: str, db=Depends(get_db)) -> Dict:
     the resume data without authentication. The share must be active
     and not expired.
 
+    Responses carry an ETag and a public Cache-Control header; a request
+    whose If-None-Match matches the current ETag gets an empty 304.
+
     Args:
         share_token: The share token from the share URL
 
     Returns:
-        dict: The parsed resume data
+        Response: The parsed resume data as JSON
 
     Raises:
         HTTPException: 404 if share not found
         HTTPException: 403 if share has been revoked
         HTTPException: 410 if share has expired
     """
-    # Get share metadata
-    share = await _get_share(share_token, db)
+    # Get share metadata (and, on a database cache miss, the resume with it)
+    share = await _get_public_share(share_token, db)
 
     if not share:
         raise HTTPException(
@@ -295,7 +375,7 @@ async def get_public_share(share_token: str, db=Depends(get_db)) -> Dict:
         )
 
     # Check if share is valid (active and not expired)
-    if not await _is_share_valid(share_token, db):
+    if not _is_share_dict_valid(share):
         # Check specific failure reason
         if not share["is_active"]:
             raise HTTPException(
@@ -309,27 +389,45 @@ async def get_public_share(share_token: str, db=Depends(get_db)) -> Dict:
             detail="This share has expired"
         )
 
-    # Get resume data
     resume_id = share["resume_id"]
-    resume_data = await _get_parsed_resume(resume_id, db)
 
-    if resume_data is None:
-        raise HTTPException(
-            status_code=404,
-            detail="Resume not found"
-        )
+    # Serve the already-rendered body while the resume data is unchanged
+    body = get_cached_share_response(share_token, resume_id)
+    if body is not None:
+        response = Response(content=body, media_type="application/json")
+    else:
+        # Get resume data
+        resume_data = await _get_parsed_resume(resume_id, db)
 
-    # Increment access count
-    await _increment_access(share_token, db)
+        if resume_data is None:
+            raise HTTPException(
+                status_code=404,
+                detail="Resume not found"
+            )
 
-    return {
-        "resume_id": resume_id,
-        "personal_info": resume_data.get("personal_info", {}),
-        "work_experience": resume_data.get("work_experience", []),
-        "education": resume_data.get("education", []),
-        "skills": resume_data.get("skills", {}),
-        "confidence_scores": resume_data.get("confidence_scores", {})
-    }
+        # Stored data is already trusted, so skip response_model validation
+        # and serialize the nested payload directly with orjson
+        response = ORJSONResponse(content={
+            "resume_id": resume_id,
+            "personal_info": resume_data.get("personal_info", {}),
+            "work_experience": resume_data.get("work_experience", []),
+            "education": resume_data.get("education", []),
+            "skills": resume_data.get("skills", {}),
+            "confidence_scores": resume_data.get("confidence_scores", {})
+        })
+        if settings.USE_DATABASE:
+            cache_share_response(share_token, resume_data, response.body)
+
+    # Increment access count (a revalidated view is still a view)
+    await _increment_access(share_token, db, background_tasks)
+
+    etag = _body_etag(response.body)
+    cache_headers = {"ETag": etag, "Cache-Control": SHARE_CACHE_CONTROL}
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers=cache_headers)
+
+    response.headers.update(cache_headers)
+    return response
 
 
 # Export response models
@@ -349,12 +447,18 @@ class EmailExportResponse(BaseModel):
 
 
 @router.get("/v1/resumes/{resume_id}/export/pdf")
-async def export_resume_pdf(resume_id: str, db=Depends(get_db)) -> FastAPIResponse:
+async def export_resume_pdf(
+    resume_id: str,
+    request: Request,
+    db=Depends(get_db)
+) -> FastAPIResponse:
     """
     Export a resume as a PDF file.
 
     This endpoint generates a PDF document from the parsed resume data,
     including personal information, work experience, education, and skills.
+    The ETag is a hash of the resume data, so a matching If-None-Match
+    gets a 304 without rendering the PDF.
 
     Args:
         resume_id: Unique identifier for the resume to export
@@ -373,8 +477,12 @@ async def export_resume_pdf(resume_id: str, db=Depends(get_db)) -> FastAPIRespon
             detail=f"Resume {resume_id} not found"
         )
 
-    # Generate PDF
-    pdf_bytes = generate_pdf(resume_data)
+    etag = f'"{content_key(resume_data)}"'
+    if _etag_matches(request, etag):
+        return FastAPIResponse(status_code=304, headers={"ETag": etag})
+
+    # Generate PDF (reused while the resume data is unchanged)
+    pdf_bytes = await get_or_render_pdf(resume_id, resume_data)
 
     # Get filename from resume data
     personal_info = resume_data.get("personal_info", {})
@@ -385,7 +493,8 @@ async def export_resume_pdf(resume_id: str, db=Depends(get_db)) -> FastAPIRespon
         content=pdf_bytes,
         media_type="application/pdf",
         headers={
-            "Content-Disposition": f'attachment; filename="{filename}"'
+            "Content-Disposition": f'attachment; filename="{filename}"',
+            "ETag": etag
         }
     )
 
@@ -416,8 +525,7 @@ async def export_resume_whatsapp(resume_id: str, db=Depends(get_db)) -> Dict:
         )
 
     # Generate WhatsApp link
-    base_url = settings.allowed_origins_list[0] if settings.allowed_origins_list else DEFAULT_BASE_URL
-    whatsapp_url = generate_whatsapp_link(resume_data, base_url)
+    whatsapp_url = generate_whatsapp_link(resume_data, _BASE_URL)
 
     return {
         "whatsapp_url": whatsapp_url
@@ -457,11 +565,10 @@ async def export_resume_telegram(resume_id: str, db=Depends(get_db)) -> Dict:
         share_token = share_data["share_token"]
 
     # Construct share URL
-    base_url = settings.allowed_origins_list[0] if settings.allowed_origins_list else DEFAULT_BASE_URL
-    share_url = f"{base_url}/shared/{share_token}"
+    share_url = _SHARE_PREFIX + share_token
 
     # Generate Telegram link with share URL
-    telegram_url = generate_telegram_link(resume_data, share_url, base_url)
+    telegram_url = generate_telegram_link(resume_data, share_url, _BASE_URL)
 
     return {
         "telegram_url": telegram_url
@@ -494,8 +601,7 @@ async def export_resume_email(resume_id: str, db=Depends(get_db)) -> Dict:
         )
 
     # Generate email link
-    base_url = settings.allowed_origins_list[0] if settings.allowed_origins_list else DEFAULT_BASE_URL
-    mailto_url = generate_email_link(resume_data, base_url)
+    mailto_url = generate_email_link(resume_data, _BASE_URL)
 
     return {
         "mailto_url": mailto_url
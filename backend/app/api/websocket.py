@@ -5,10 +5,30 @@ This module provides a connection manager that handles WebSocket connections
 for broadcasting resume parsing progress to connected clients.
 """
 
-from typing import Dict, Set
+from typing import Dict, List
 from fastapi import WebSocket, WebSocketDisconnect
-import json
+from starlette.websockets import WebSocketState
 import asyncio
+import logging
+import weakref
+
+import orjson
+
+from app.models.progress import ProgressStage
+
+logger = logging.getLogger(__name__)
+
+# Intermediate progress updates for a resume arriving within this window
+# (seconds) are coalesced, so watchers only receive the latest one
+PROGRESS_COALESCE_WINDOW = 0.05
+
+# Stages whose updates may be coalesced; complete and error updates are
+# status changes and always go out immediately
+_COALESCED_STAGES = frozenset({
+    ProgressStage.TEXT_EXTRACTION.value,
+    ProgressStage.NLP_PARSING.value,
+    ProgressStage.AI_ENHANCEMENT.value,
+})
 
 
 class ConnectionManager:
@@ -22,8 +42,14 @@ class ConnectionManager:
 
     def __init__(self) -> None:
         """Initialize the connection manager with an empty connection registry."""
-        # Map resume_id to set of WebSocket connections
-        self.active_connections: Dict[str, Set[WebSocket]] = {}
+        # Map resume_id to list of weak references to WebSocket connections;
+        # a list because broadcasts iterate far more often than watchers come
+        # and go, and weak so a socket dropped without our disconnect path
+        # running (TCP reset, handler crash) is not kept alive by the registry
+        self.active_connections: Dict[str, List[weakref.ref]] = {}
+        # Latest not-yet-sent progress update and its flush task, by resume_id
+        self._pending_progress: Dict[str, dict] = {}
+        self._flush_tasks: Dict[str, asyncio.Task] = {}
 
     async def connect(self, websocket: WebSocket, resume_id: str) -> None:
         """
@@ -34,9 +60,9 @@ class ConnectionManager:
             resume_id: The unique identifier for the resume being watched
         """
         await websocket.accept()
-        if resume_id not in self.active_connections:
-            self.active_connections[resume_id] = set()
-        self.active_connections[resume_id].add(websocket)
+        self.active_connections.setdefault(resume_id, []).append(
+            weakref.ref(websocket, lambda ref: self._discard(ref, resume_id))
+        )
 
         # Send connection confirmation
         await self.send_personal_message(
@@ -56,11 +82,36 @@ class ConnectionManager:
             websocket: The WebSocket connection to remove
             resume_id: The resume ID associated with the connection
         """
-        if resume_id in self.active_connections:
-            self.active_connections[resume_id].discard(websocket)
-            # Clean up empty connection sets
-            if not self.active_connections[resume_id]:
-                del self.active_connections[resume_id]
+        for ref in self.active_connections.get(resume_id, []):
+            if ref() is websocket:
+                self._discard(ref, resume_id)
+                return
+        # Not found: already removed (e.g. by a failed broadcast)
+
+    def _discard(self, ref: weakref.ref, resume_id: str) -> None:
+        """
+        Drop a connection reference from the registry.
+
+        Also used as the weakref callback, so connections that were garbage
+        collected without being disconnected are cleaned up.
+
+        Args:
+            ref: Weak reference to the connection to drop
+            resume_id: The resume ID associated with the connection
+        """
+        connections = self.active_connections.get(resume_id)
+        if connections is None:
+            return
+        # Remove by identity: live weakrefs compare by their referents
+        for index, existing in enumerate(connections):
+            if existing is ref:
+                del connections[index]
+                break
+        else:
+            return
+        # Clean up empty connection lists
+        if not connections:
+            del self.active_connections[resume_id]
 
     async def send_personal_message(self, message: dict, websocket: WebSocket) -> None:
         """
@@ -74,53 +125,151 @@ class ConnectionManager:
             await websocket.send_json(message)
         except RuntimeError as e:
             # Connection may be closed
-            import logging
-            logging.getLogger(__name__).error(f"WebSocket RuntimeError: {e}", exc_info=True)
-            print(f"Error sending personal message: {e}")
+            logger.error(f"WebSocket RuntimeError: {e}", exc_info=True)
         except TypeError as e:
             # JSON serialization error
-            import logging
-            logging.getLogger(__name__).error(f"WebSocket serialization error: {e}", exc_info=True)
-            print(f"Serialization error: {e}")
+            logger.error(f"WebSocket serialization error: {e}", exc_info=True)
+        except Exception as e:
+            logger.error(f"WebSocket error: {type(e).__name__}: {e}", exc_info=True)
+
+    async def send_personal_text(self, payload: str, websocket: WebSocket) -> None:
+        """
+        Send an already-serialized JSON message to a specific WebSocket connection.
+
+        Args:
+            payload: The JSON-encoded message to send
+            websocket: The target WebSocket connection
+        """
+        try:
+            await websocket.send_text(payload)
+        except RuntimeError as e:
+            # Connection may be closed
+            logger.error(f"WebSocket RuntimeError: {e}", exc_info=True)
         except Exception as e:
-            import logging
-            logging.getLogger(__name__).error(f"WebSocket error: {type(e).__name__}: {e}", exc_info=True)
-            print(f"Unexpected error sending message: {type(e).__name__}: {e}")
+            logger.error(f"WebSocket error: {type(e).__name__}: {e}", exc_info=True)
+
+    async def send_personal_bytes(self, payload: bytes, websocket: WebSocket) -> None:
+        """
+        Send an already-serialized JSON message as a binary frame.
+
+        Args:
+            payload: The JSON-encoded message to send
+            websocket: The target WebSocket connection
+        """
+        try:
+            await websocket.send_bytes(payload)
+        except RuntimeError as e:
+            # Connection may be closed
+            logger.error(f"WebSocket RuntimeError: {e}", exc_info=True)
+        except Exception as e:
+            logger.error(f"WebSocket error: {type(e).__name__}: {e}", exc_info=True)
 
     async def broadcast_to_resume(self, message: dict, resume_id: str) -> None:
         """
         Broadcast a message to all connections watching a specific resume.
 
+        Intermediate progress updates are held for PROGRESS_COALESCE_WINDOW
+        and only the latest one is sent. Any other message is sent at once
+        and supersedes a progress update still waiting to be sent.
+
         Args:
             message: The message dictionary to broadcast
             resume_id: The resume ID whose watchers should receive the message
         """
-        if resume_id in self.active_connections:
-            disconnected = set()
-            for connection in self.active_connections[resume_id]:
-                try:
-                    # Check WebSocket client state before sending
-                    # CLIENT_CLOSED means the connection is no longer valid
-                    if getattr(connection, 'client_state', None) != 'DISCONNECTED':
-                        await connection.send_json(message)
-                    else:
-                        # Connection is already closed, mark for cleanup
-                        disconnected.add(connection)
-                except (RuntimeError, WebSocketDisconnect):
-                    # Mark disconnected WebSockets for cleanup
-                    disconnected.add(connection)
-                except Exception as e:
-                    # Log with more context for debugging
-                    import logging
-                    logging.getLogger(__name__).warning(
-                        f"Failed to broadcast to resume {resume_id}: {e}",
-                        exc_info=True
-                    )
-                    disconnected.add(connection)
-
-            # Clean up disconnected WebSockets
-            for connection in disconnected:
-                self.disconnect(connection, resume_id)
+        if (
+            message.get("type") == "progress_update"
+            and message.get("stage") in _COALESCED_STAGES
+        ):
+            self._pending_progress[resume_id] = message
+            if resume_id not in self._flush_tasks:
+                self._flush_tasks[resume_id] = asyncio.create_task(
+                    self._flush_progress(resume_id)
+                )
+            return
+
+        self._pending_progress.pop(resume_id, None)
+        flush_task = self._flush_tasks.pop(resume_id, None)
+        if flush_task is not None:
+            flush_task.cancel()
+
+        await self._send_to_resume(message, resume_id)
+
+    async def _flush_progress(self, resume_id: str) -> None:
+        """
+        Send the latest pending progress update once the window has passed.
+
+        Args:
+            resume_id: The resume ID whose pending update should be sent
+        """
+        await asyncio.sleep(PROGRESS_COALESCE_WINDOW)
+        # Unregister before sending, so a status change arriving mid-send
+        # doesn't cancel a partially written frame
+        self._flush_tasks.pop(resume_id, None)
+        message = self._pending_progress.pop(resume_id, None)
+        if message is not None:
+            await self._send_to_resume(message, resume_id)
+
+    async def _send_to_resume(self, message: dict, resume_id: str) -> None:
+        """
+        Send a message to every live connection watching a specific resume.
+
+        Args:
+            message: The message dictionary to send
+            resume_id: The resume ID whose watchers should receive the message
+        """
+        # Dereference into a strong snapshot, since watchers may disconnect
+        # while sends are in flight; collected sockets yield None and are skipped
+        connections = [
+            connection
+            for ref in self.active_connections.get(resume_id, [])
+            if (connection := ref()) is not None
+        ]
+        if not connections:
+            return
+
+        # Serialize once for all watchers with orjson; sent as a text frame
+        # since clients parse event.data as a JSON string
+        try:
+            payload = orjson.dumps(message).decode()
+        except TypeError as e:
+            logger.error(f"WebSocket serialization error: {e}", exc_info=True)
+            return
+
+        disconnected = set()
+        sendable = []
+        for connection in connections:
+            # Check WebSocket state before sending; a socket closed by
+            # either side is no longer valid and would raise on send
+            if (
+                connection.client_state == WebSocketState.CONNECTED
+                and connection.application_state == WebSocketState.CONNECTED
+            ):
+                sendable.append(connection)
+            else:
+                # Connection is already closed, mark for cleanup
+                disconnected.add(connection)
+
+        # Send to all watchers concurrently, so one slow client doesn't
+        # delay the others
+        results = await asyncio.gather(
+            *(connection.send_text(payload) for connection in sendable),
+            return_exceptions=True
+        )
+        for connection, result in zip(sendable, results):
+            if isinstance(result, (RuntimeError, WebSocketDisconnect)):
+                # Mark disconnected WebSockets for cleanup
+                disconnected.add(connection)
+            elif isinstance(result, Exception):
+                # Log with more context for debugging
+                logger.warning(
+                    f"Failed to broadcast to resume {resume_id}: {result}",
+                    exc_info=result
+                )
+                disconnected.add(connection)
+
+        # Clean up disconnected WebSockets
+        for connection in disconnected:
+            self.disconnect(connection, resume_id)
 
 
 # Global connection manager instance
@@ -0,0 +1,130 @@
+"""
+In-process caches for hot read paths.
+
+These caches are per worker process. Entries expire after a short TTL, so
+other instances (e.g. parallel serverless containers) converge without
+explicit cross-process invalidation; writes in this process invalidate
+their entries immediately.
+"""
+
+from typing import Any, Dict, Optional
+
+from cachetools import TTLCache
+
+# Parsed resume data by resume_id, for share/public/export reads
+_parsed_resume_cache: TTLCache = TTLCache(maxsize=1024, ttl=60)
+
+# Share metadata by share_token, for repeated public share hits
+_share_cache: TTLCache = TTLCache(maxsize=4096, ttl=5)
+
+# Rendered public share bodies by share_token: (parsed_data, body)
+_share_response_cache: TTLCache = TTLCache(maxsize=4096, ttl=5)
+
+
+def get_cached_parsed_resume(resume_id: str) -> Optional[Dict[str, Any]]:
+    """
+    Return cached parsed resume data, or None if absent or expired.
+
+    Args:
+        resume_id: Unique identifier for the resume
+    """
+    return _parsed_resume_cache.get(resume_id)
+
+
+def cache_parsed_resume(resume_id: str, parsed_data: Dict[str, Any]) -> None:
+    """
+    Cache parsed resume data for subsequent reads.
+
+    Args:
+        resume_id: Unique identifier for the resume
+        parsed_data: Parsed resume data dictionary
+    """
+    _parsed_resume_cache[resume_id] = parsed_data
+
+
+def invalidate_parsed_resume(resume_id: str) -> None:
+    """
+    Drop a resume's cached parsed data after it has been modified.
+
+    Args:
+        resume_id: Unique identifier for the resume
+    """
+    _parsed_resume_cache.pop(resume_id, None)
+
+
+def get_cached_share(share_token: str) -> Optional[Dict[str, Any]]:
+    """
+    Return cached share metadata, or None if absent or expired.
+
+    Args:
+        share_token: The share token to look up
+    """
+    return _share_cache.get(share_token)
+
+
+def cache_share(share_token: str, share: Dict[str, Any]) -> None:
+    """
+    Cache share metadata for subsequent public accesses.
+
+    Args:
+        share_token: The share token
+        share: Share metadata dictionary
+    """
+    _share_cache[share_token] = share
+
+
+def invalidate_share(share_token: str) -> None:
+    """
+    Drop a share's cached metadata and response after it has been revoked.
+
+    Args:
+        share_token: The share token
+    """
+    _share_cache.pop(share_token, None)
+    _share_response_cache.pop(share_token, None)
+
+
+def get_cached_share_response(share_token: str, resume_id: str) -> Optional[bytes]:
+    """
+    Return the cached public share body, or None if absent or stale.
+
+    A body is only served while the resume's cached parsed data is the
+    same object it was rendered from, so invalidate_parsed_resume also
+    invalidates every share response for that resume.
+
+    Args:
+        share_token: The share token
+        resume_id: Unique identifier for the shared resume
+    """
+    entry = _share_response_cache.get(share_token)
+    if entry is None:
+        return None
+    parsed_data, body = entry
+    if _parsed_resume_cache.get(resume_id) is not parsed_data:
+        return None
+    return body
+
+
+def cache_share_response(
+    share_token: str,
+    parsed_data: Dict[str, Any],
+    body: bytes
+) -> None:
+    """
+    Cache a rendered public share body.
+
+    Args:
+        share_token: The share token
+        parsed_data: The cached parsed resume data the body was rendered from
+        body: Serialized response body
+    """
+    _share_response_cache[share_token] = (parsed_data, body)
+
+
+def clear_caches() -> None:
+    """
+    Clear all in-process caches (for testing).
+    """
+    _parsed_resume_cache.clear()
+    _share_cache.clear()
+    _share_response_cache.clear()
@@ -5,13 +5,18 @@ This module uses Pydantic Settings to load configuration from environment variab
 and .env file. All sensitive configuration should come from environment variables.
 """
 
-from functools import lru_cache
-from typing import List
+import re
+from functools import cached_property
+from typing import List, Optional, Tuple, Union
 
 from pydantic import field_validator, Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
+# Comma with any surrounding whitespace, separating CORS origins
+_ORIGIN_SEPARATOR = re.compile(r"\s*,\s*")
+
+
 class Settings(BaseSettings):
     """
     Application settings loaded from environment variables.
@@ -40,6 +45,33 @@ class Settings(BaseSettings):
         default=False,
         description="Enable PostgreSQL database storage (vs in-memory)"
     )
+    DB_STATEMENT_CACHE_SIZE: int = Field(
+        default=1024,
+        description=(
+            "Prepared statements cached per asyncpg connection "
+            "(0 disables, e.g. behind PgBouncer)"
+        )
+    )
+    DB_POOL_SIZE: int = Field(
+        default=20,
+        description="Connections kept open in the pool (ignored on serverless, which uses no pool)"
+    )
+    DB_MAX_OVERFLOW: int = Field(
+        default=10,
+        description="Extra connections opened beyond DB_POOL_SIZE under load"
+    )
+    DB_POOL_TIMEOUT: int = Field(
+        default=30,
+        description="Seconds to wait for a pooled connection before failing"
+    )
+    DB_POOL_PRE_PING: bool = Field(
+        default=False,
+        description="Ping pooled connections before each checkout (always on in development)"
+    )
+    DB_DISABLE_JIT: bool = Field(
+        default=True,
+        description="Turn off PostgreSQL JIT compilation for the short queries this API runs"
+    )
 
     # Redis
     REDIS_URL: str = Field(
@@ -89,6 +121,10 @@ class Settings(BaseSettings):
     )
 
     # Storage
+    RESUME_STORE_MAX_ENTRIES: int = Field(
+        default=10000,
+        description="Maximum resumes kept by in-memory storage before LRU eviction"
+    )
     STORAGE_BACKEND: str = Field(
         default="local",
         description="Storage backend: local, s3, gcs"
@@ -132,53 +168,72 @@ class Settings(BaseSettings):
 
     @field_validator("ALLOWED_ORIGINS", mode="before")
     @classmethod
-    def parse_cors_origins(cls, v: str) -> str:
-        """Validate CORS origins are properly formatted."""
-        if isinstance(v, str):
-            return v
-        return ",".join(v) if isinstance(v, list) else str(v)
-
-    @property
-    def allowed_origins_list(self) -> List[str]:
-        """Return CORS origins as a list."""
-        return [origin.strip() for origin in self.ALLOWED_ORIGINS.split(",") if origin.strip()]
-
-    @property
+    def parse_cors_origins(cls, v: Union[str, List[str], Tuple[str, ...]]) -> str:
+        """
+        Normalize CORS origins once at validation time.
+
+        Accepts a comma-separated string, list or tuple and returns a
+        comma-separated string with whitespace and empty entries removed.
+        The field stays a string so pydantic-settings reads the env var
+        as-is instead of expecting JSON.
+        """
+        if isinstance(v, (list, tuple)):
+            origins = [origin.strip() for origin in v]
+        else:
+            origins = _ORIGIN_SEPARATOR.split(str(v).strip())
+        return ",".join(origin for origin in origins if origin)
+
+    # Derived values below are computed on first access and cached, since
+    # settings are read on request paths but never change after startup
+
+    @cached_property
+    def allowed_origins_list(self) -> Tuple[str, ...]:
+        """Return CORS origins as a tuple (already normalized by the validator)."""
+        return tuple(self.ALLOWED_ORIGINS.split(",")) if self.ALLOWED_ORIGINS else ()
+
+    @cached_property
     def is_development(self) -> bool:
         """Check if running in development mode."""
         return self.ENVIRONMENT.lower() in ("development", "dev")
 
-    @property
+    @cached_property
     def is_production(self) -> bool:
         """Check if running in production mode."""
         return self.ENVIRONMENT.lower() in ("production", "prod")
 
-    @property
+    @cached_property
     def is_testing(self) -> bool:
         """Check if running in testing mode."""
         return self.ENVIRONMENT.lower() in ("testing", "test")
 
 
-@lru_cache()
+# Process-wide settings instance, created on first use
+_settings: Optional[Settings] = None
+
+
 def get_settings() -> Settings:
     """
     Get cached settings instance.
 
-    This function caches the settings instance to avoid repeated loading
-    from environment variables. The cache is created per-settings instance.
+    The instance is created on the first call and held in a module global,
+    avoiding repeated loading from environment variables without the
+    argument hashing of an lru_cache wrapper on every call.
 
     Returns:
         Settings: The application settings instance
     """
-    return Settings()
+    global _settings
+    if _settings is None:
+        _settings = Settings()
+    return _settings
 
 
 def clear_settings_cache() -> None:
     """
     Clear the cached settings instance.
 
-    This function clears the LRU cache for get_settings(), forcing a reload
-    of environment variables on the next call to get_settings().
+    This function drops the cached instance, forcing a reload of
+    environment variables on the next call to get_settings().
 
     Use this in tests to reset settings between test runs when using
     monkeypatch.setenv() to change environment variables.
@@ -188,7 +243,8 @@ def clear_settings_cache() -> None:
         clear_settings_cache()
         settings = get_settings()  # Will reload with new env vars
     """
-    get_settings.cache_clear()
+    global _settings
+    _settings = None
 
 
 # Global settings instance
@@ -7,8 +7,10 @@ and provides dependency injection for FastAPI routes.
 import os
 
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator, Optional
+from typing import Any, AsyncGenerator, Optional
 
+import orjson
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     AsyncEngine,
@@ -24,6 +26,20 @@ from app.core.config import settings
 # If so, skip engine initialization to avoid async/sync conflicts
 IS_RUNNING_MIGRATION = os.getenv("ALEMBIC_RUNNING", "false").lower() == "true"
 
+# Serverless runtimes (Vercel, AWS Lambda, Google Cloud Functions) freeze the
+# process between invocations, so pooled connections go stale instead of
+# being reused
+IS_SERVERLESS = bool(
+    os.getenv("VERCEL")
+    or os.getenv("AWS_LAMBDA_FUNCTION_NAME")
+    or os.getenv("FUNCTION_TARGET")
+)
+
+
+def _json_serializer(value: Any) -> str:
+    """Serialize JSON/JSONB column values with orjson."""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
 
 class Base(DeclarativeBase):
     """
@@ -95,7 +111,9 @@ class DatabaseManager:
         echo: bool = False,
         pool_size: int = 5,
         max_overflow: int = 10,
+        pool_timeout: int = 30,
         pool_pre_ping: bool = True,
+        pool_recycle: int = 1800,
     ) -> AsyncEngine:
         """
         Initialize the database engine and session factory.
@@ -104,7 +122,10 @@ class DatabaseManager:
             echo: If True, log all SQL statements.
             pool_size: The size of the connection pool.
             max_overflow: The max overflow size of the pool.
+            pool_timeout: Seconds to wait for a connection from the pool.
             pool_pre_ping: If True, test connections before using.
+            pool_recycle: Seconds after which pooled connections are replaced,
+                         so idle connections dropped by the server are not reused.
 
         Returns:
             AsyncEngine: The initialized engine instance.
@@ -112,13 +133,28 @@ class DatabaseManager:
         engine_kwargs = {
             "echo": echo,
             "pool_pre_ping": pool_pre_ping,
-            "pool_size": pool_size,
-            "max_overflow": max_overflow,
+            # Parsed resumes are stored as JSONB; encode and decode them with
+            # orjson rather than the stdlib json module
+            "json_serializer": _json_serializer,
+            "json_deserializer": orjson.loads,
         }
 
-        # Use NullPool for testing to avoid connection issues
-        if settings.is_testing:
+        # Use NullPool for testing to avoid connection issues, and on
+        # serverless where a pool would only hold connections across freezes
+        # NullPool rejects sizing arguments, so only pass them to QueuePool
+        if settings.is_testing or IS_SERVERLESS:
             engine_kwargs["poolclass"] = NullPool
+            # Every checkout opens a fresh connection, so pinging it first
+            # would only add a round trip
+            engine_kwargs["pool_pre_ping"] = False
+        else:
+            engine_kwargs["pool_size"] = pool_size
+            engine_kwargs["max_overflow"] = max_overflow
+            engine_kwargs["pool_timeout"] = pool_timeout
+            engine_kwargs["pool_recycle"] = pool_recycle
+
+        if make_url(self._database_url).get_driver_name() == "asyncpg":
+            engine_kwargs["connect_args"] = self._asyncpg_connect_args()
 
         self._engine = create_async_engine(self._database_url, **engine_kwargs)
 
@@ -132,6 +168,27 @@ class DatabaseManager:
 
         return self._engine
 
+    @staticmethod
+    def _asyncpg_connect_args() -> dict:
+        """
+        Build asyncpg connection arguments from settings.
+
+        Sizes both SQLAlchemy's prepared statement cache and asyncpg's own
+        statement cache, so repeated queries skip the parse/plan round trip,
+        and optionally turns off server-side JIT, whose compile time exceeds
+        the runtime of the small indexed lookups this API issues.
+
+        Returns:
+            dict: Keyword arguments for the asyncpg connect call
+        """
+        connect_args: dict = {
+            "prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+            "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+        }
+        if settings.DB_DISABLE_JIT:
+            connect_args["server_settings"] = {"jit": "off"}
+        return connect_args
+
     async def close(self) -> None:
         """Close the database engine and dispose of all connections."""
         if self._engine is not None:
@@ -156,14 +213,10 @@ class DatabaseManager:
                 "Session factory not initialized. Call init_engine() first."
             )
 
+        # Exiting the session closes it, which also rolls back any
+        # transaction left open by an exception
         async with self._session_factory() as session:
-            try:
-                yield session
-            except Exception:
-                await session.rollback()
-                raise
-            finally:
-                await session.close()
+            yield session
 
 
 # Global database manager instance
@@ -195,7 +248,15 @@ def get_engine() -> AsyncEngine:
     global engine, AsyncSessionLocal
 
     if engine is None:
-        engine = db_manager.init_engine(echo=settings.is_development)
+        # Pre-ping costs a round trip on every checkout; outside development
+        # stale connections are instead bounded by pool_recycle
+        engine = db_manager.init_engine(
+            echo=settings.is_development,
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT,
+            pool_pre_ping=settings.DB_POOL_PRE_PING or settings.is_development,
+        )
         AsyncSessionLocal = db_manager.session_factory
 
     return engine
@@ -237,17 +298,14 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             result = await db.execute(select(Resume))
             return result.scalars().all()
     """
-    # Lazy initialization: get_session_factory will create engine if needed
-    factory = get_session_factory()
+    # Read the initialized factory directly; only the first request takes
+    # the get_session_factory() path that creates the engine
+    factory = AsyncSessionLocal or get_session_factory()
 
+    # Exiting the session closes it, which also rolls back any transaction
+    # left open by an exception
     async with factory() as session:
-        try:
-            yield session
-        except Exception:
-            await session.rollback()
-            raise
-        finally:
-            await session.close()
+        yield session
 
 
 async def init_db() -> None:
@@ -0,0 +1,28 @@
+"""
+Time-ordered identifier generation.
+
+Random UUIDv4 primary keys scatter inserts across the whole B-tree index.
+UUIDv7 (RFC 9562) prefixes the random bits with a millisecond timestamp,
+so new rows land on the right-most index pages and recent pages stay hot.
+"""
+
+import os
+import time
+import uuid
+
+_VERSION_MASK = 0xF << 76
+_VARIANT_MASK = 0x3 << 62
+
+
+def uuid7() -> uuid.UUID:
+    """
+    Generate a UUIDv7: 48-bit Unix milliseconds followed by random bits.
+
+    Returns:
+        uuid.UUID: A time-ordered UUID, compatible with PostgreSQL UUID columns
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    value = (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80 | int.from_bytes(os.urandom(10), "big")
+    value = (value & ~_VERSION_MASK) | (0x7 << 76)
+    value = (value & ~_VARIANT_MASK) | (0x2 << 62)
+    return uuid.UUID(int=value)
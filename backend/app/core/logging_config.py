@@ -0,0 +1,47 @@
+"""
+Non-blocking logging setup.
+
+Handlers that write to a stream take a lock and flush synchronously, so a
+burst of log records (e.g. many failing parse jobs) would block the event
+loop. Records are instead put on a queue by a QueueHandler and written by
+a QueueListener on its own thread.
+"""
+
+import atexit
+import logging
+import logging.handlers
+import queue
+from typing import Optional
+
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def configure_logging() -> None:
+    """
+    Route root logger output through a background QueueListener thread.
+
+    The listener writes to stderr. If the root logger already has handlers
+    (logging configured by the host, a test runner or a log config file),
+    it is left untouched. Calling this more than once has no further effect.
+    """
+    global _listener
+
+    root = logging.getLogger()
+    if _listener is not None or root.handlers:
+        return
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    _listener = logging.handlers.QueueListener(log_queue, logging.StreamHandler())
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+
+    _listener.start()
+    atexit.register(_stop_listener)
+
+
+def _stop_listener() -> None:
+    """Flush queued records and stop the listener thread."""
+    global _listener
+
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
@@ -5,14 +5,18 @@ This service manages shareable links for resumes, including token generation,
 access tracking, expiration, and revocation.
 """
 
-from typing import Dict, Optional
-from datetime import datetime, timedelta
+from typing import Dict, Iterable, Optional
+from datetime import datetime, timedelta, timezone
+import time
 import uuid
 
 
 # In-memory store: {share_token: share_metadata}
 _share_store: Dict[str, dict] = {}
 
+# Reverse index: {resume_id: share_token} of the newest active share
+_resume_to_token: Dict[str, str] = {}
+
 
 def create_share(resume_id: str, expires_in_days: int = 30) -> dict:
     """
@@ -26,22 +30,28 @@ def create_share(resume_id: str, expires_in_days: int = 30) -> dict:
         Dictionary containing share_token and expires_at
     """
     share_token = str(uuid.uuid4())
-    expires_at = datetime.utcnow() + timedelta(days=expires_in_days)
+    created_at = datetime.utcnow()
+    expires_at = created_at + timedelta(days=expires_in_days)
+    expires_at_iso = expires_at.isoformat()
 
     share_metadata = {
         "share_token": share_token,
         "resume_id": resume_id,
-        "created_at": datetime.utcnow().isoformat(),
-        "expires_at": expires_at.isoformat(),
+        "created_at": created_at.isoformat(),
+        "expires_at": expires_at_iso,
+        # Precomputed so validity checks compare floats instead of parsing
+        # the ISO string on every access
+        "expires_at_epoch": expires_at.replace(tzinfo=timezone.utc).timestamp(),
         "access_count": 0,
         "is_active": True
     }
 
     _share_store[share_token] = share_metadata
+    _resume_to_token[resume_id] = share_token
 
     return {
         "share_token": share_token,
-        "expires_at": expires_at.isoformat()
+        "expires_at": expires_at_iso
     }
 
 
@@ -58,6 +68,20 @@ def get_share(share_token: str) -> Optional[dict]:
     return _share_store.get(share_token)
 
 
+def get_shares(share_tokens: Iterable[str]) -> Dict[str, Optional[dict]]:
+    """
+    Retrieve metadata for many shares at once.
+
+    Args:
+        share_tokens: The share tokens to look up
+
+    Returns:
+        Dictionary mapping each requested token to its share metadata,
+        or to None if not found
+    """
+    return {share_token: _share_store.get(share_token) for share_token in share_tokens}
+
+
 def increment_access(share_token: str) -> bool:
     """
     Increment the access count for a share.
@@ -84,10 +108,46 @@ def revoke_share(share_token: str) -> bool:
     Returns:
         True if revoked successfully, False if share not found
     """
-    if share_token in _share_store:
-        _share_store[share_token]["is_active"] = False
-        return True
-    return False
+    share = _share_store.get(share_token)
+    if share is None:
+        return False
+
+    share["is_active"] = False
+    if _resume_to_token.get(share["resume_id"]) == share_token:
+        del _resume_to_token[share["resume_id"]]
+    return True
+
+
+def get_share_token_by_resume_id(resume_id: str) -> Optional[str]:
+    """
+    Find the active share token for a resume.
+
+    Uses the resume_id -> token reverse index, so the lookup is a single
+    dict probe instead of a scan over every stored share.
+
+    Args:
+        resume_id: The resume ID to find shares for
+
+    Returns:
+        The newest active share token, or None if the resume has none
+    """
+    return _resume_to_token.get(resume_id)
+
+
+def get_share_by_resume_id(resume_id: str) -> Optional[dict]:
+    """
+    Retrieve the active share metadata for a resume.
+
+    Args:
+        resume_id: The resume ID to find the share for
+
+    Returns:
+        Share metadata dictionary of the newest active share, or None
+    """
+    share_token = _resume_to_token.get(resume_id)
+    if share_token is None:
+        return None
+    return _share_store.get(share_token)
 
 
 def is_share_valid(share_token: str) -> bool:
@@ -101,24 +161,13 @@ def is_share_valid(share_token: str) -> bool:
         True if share is active and not expired, False otherwise
     """
     share = _share_store.get(share_token)
-    if not share:
-        return False
-
-    # Check if active
-    if not share["is_active"]:
-        return False
-
-    # Check expiration
-    expires_at = datetime.fromisoformat(share["expires_at"])
-    if datetime.utcnow() > expires_at:
-        return False
-
-    return True
+    return bool(share) and share["is_active"] and time.time() <= share["expires_at_epoch"]
 
 
 def clear_all_shares() -> None:
     """
     Clear all stored shares (for testing).
     """
-    global _share_store
+    global _share_store, _resume_to_token
     _share_store = {}
+    _resume_to_token = {}
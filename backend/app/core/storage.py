@@ -6,10 +6,16 @@ replaced with PostgreSQL database persistence.
 """
 
 from typing import Dict, Optional
-from datetime import datetime
+import time
 
-# In-memory store: {resume_id: parsed_data}
-_resume_store: Dict[str, dict] = {}
+from cachetools import LRUCache
+
+from app.core.config import settings
+
+# In-memory store: {resume_id: parsed_data}, bounded so a long-running
+# process evicts the least recently used resumes instead of growing forever.
+# Timestamps are kept as epoch floats, since they are never sent to clients
+_resume_store: LRUCache = LRUCache(maxsize=settings.RESUME_STORE_MAX_ENTRIES)
 
 
 def save_parsed_resume(resume_id: str, parsed_data: dict) -> None:
@@ -22,7 +28,7 @@ def save_parsed_resume(resume_id: str, parsed_data: dict) -> None:
     """
     _resume_store[resume_id] = {
         "data": parsed_data,
-        "created_at": datetime.utcnow().isoformat()
+        "created_at": time.time()
     }
 
 
@@ -36,9 +42,8 @@ def get_parsed_resume(resume_id: str) -> Optional[dict]:
     Returns:
         Parsed resume data dictionary, or None if not found
     """
-    if resume_id in _resume_store:
-        return _resume_store[resume_id]["data"]
-    return None
+    entry = _resume_store.get(resume_id)
+    return entry["data"] if entry is not None else None
 
 
 def update_parsed_resume(resume_id: str, updated_data: dict) -> bool:
@@ -52,11 +57,12 @@ def update_parsed_resume(resume_id: str, updated_data: dict) -> bool:
     Returns:
         True if updated successfully, False if resume not found
     """
-    if resume_id not in _resume_store:
+    entry = _resume_store.get(resume_id)
+    if entry is None:
         return False
 
-    _resume_store[resume_id]["data"] = updated_data
-    _resume_store[resume_id]["updated_at"] = datetime.utcnow().isoformat()
+    entry["data"] = updated_data
+    entry["updated_at"] = time.time()
     return True
 
 
@@ -83,12 +89,11 @@ def get_all_resumes() -> Dict[str, dict]:
     Returns:
         Dictionary of all resume_id -> data pairs
     """
-    return _resume_store.copy()
+    return dict(_resume_store)
 
 
 def clear_all_resumes() -> None:
     """
     Clear all stored resumes (for testing).
     """
-    global _resume_store
-    _resume_store = {}
+    _resume_store.clear()
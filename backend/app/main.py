@@ -6,20 +6,43 @@ includes all API routers, and defines health check endpoints.
 """
 
 import logging
+import time
 from typing import Optional
 
+import orjson
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect, Depends
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, Response
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
 from app.core.database import get_db
+from app.core.logging_config import configure_logging
 from app.api import resumes, shares
 from app.api.websocket import manager
 
-# Setup logging
+# Setup logging; records are written off the event loop by a listener thread
+configure_logging()
 logger = logging.getLogger(__name__)
 
+# (epoch second, ISO string) for the most recent health check timestamp
+_timestamp_cache: tuple[int, str] = (0, "")
+
+
+def _utc_timestamp() -> str:
+    """
+    Return the current UTC time as an ISO 8601 string.
+
+    The formatted string is cached per second, so frequent health probes
+    reuse it instead of building and formatting a datetime on every call.
+    """
+    global _timestamp_cache
+    now = int(time.time())
+    if now != _timestamp_cache[0]:
+        _timestamp_cache = (now, time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(now)))
+    return _timestamp_cache[1]
+
 # Create FastAPI application instance
 app = FastAPI(
     title="ResuMate API",
@@ -27,15 +50,22 @@ app = FastAPI(
     version=settings.APP_VERSION,
     docs_url="/docs" if settings.is_development else None,
     redoc_url="/redoc" if settings.is_development else None,
+    # Serialize every route's response with orjson unless it says otherwise
+    default_response_class=ORJSONResponse,
 )
 
-# Configure CORS middleware
+# Configure CORS middleware; Starlette only tests origins for membership,
+# so a frozenset makes the per-request check a hash lookup
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=settings.allowed_origins_list,
+    allow_origins=frozenset(settings.allowed_origins_list),
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    # Explicit lists instead of wildcards: preflights answer with the fixed
+    # lists Starlette joins once at startup, rather than echoing each request
+    allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
+    allow_headers=["Content-Type"],
+    # Let browsers reuse a preflight result for a day
+    max_age=86400,
 )
 
 # Include API routers
@@ -43,6 +73,12 @@ app.include_router(resumes.router)
 app.include_router(shares.router)
 
 
+# Heartbeat reply, serialized once instead of on every ping; binary pings
+# are answered with a binary frame, text pings with a text frame
+_PONG_BYTES = orjson.dumps({"type": "pong", "message": "alive"})
+_PONG = _PONG_BYTES.decode()
+
+
 @app.websocket("/ws/resumes/{resume_id}")
 async def websocket_endpoint(websocket: WebSocket, resume_id: str):
     """
@@ -60,20 +96,100 @@ async def websocket_endpoint(websocket: WebSocket, resume_id: str):
     try:
         # Keep connection alive and handle incoming messages
         while True:
-            data = await websocket.receive_text()
+            # Read raw messages so both text and binary frames are accepted
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                raise WebSocketDisconnect(message.get("code", 1000))
             # Handle any client messages (like ping/pong)
-            if data == "ping":
-                await manager.send_personal_message(
-                    {"type": "pong", "message": "alive"},
-                    websocket,
-                )
+            if message.get("text") == "ping":
+                await manager.send_personal_text(_PONG, websocket)
+            elif message.get("bytes") == b"ping":
+                await manager.send_personal_bytes(_PONG_BYTES, websocket)
     except WebSocketDisconnect:
         manager.disconnect(websocket, resume_id)
     except Exception as e:
-        print(f"WebSocket error: {e}")
+        logger.error(f"WebSocket error: {e}", exc_info=True)
         manager.disconnect(websocket, resume_id)
 
 
+# Fields of the health response that never change while the process runs
+_HEALTH_BASE = {
+    "status": "healthy",
+    "version": settings.APP_VERSION,
+    "environment": settings.ENVIRONMENT,
+    "database": "unknown",
+}
+
+# Serialized healthy response up to (not including) the closing brace; the
+# common case only appends the timestamp instead of building and encoding
+# a dict per probe
+_HEALTHY_PREFIX = orjson.dumps({**_HEALTH_BASE, "database": "connected"})[:-1]
+
+# Connectivity probe, constructed once rather than per health check
+_SELECT_ONE = text("SELECT 1")
+
+# Seconds a database probe result is reused by later health checks
+HEALTH_CACHE_TTL = 5.0
+
+# Seconds the last successful probe keeps being reported while the database
+# is failing, so a brief outage doesn't turn every probe into a new attempt
+HEALTH_STALE_FOR = 30.0
+
+
+class _HealthCache:
+    """Most recent database probe result, shared by all health checks."""
+
+    def __init__(self) -> None:
+        self.checked_at: Optional[float] = None
+        self.ok = False
+        self.error: Optional[str] = None
+        self.last_ok_at: Optional[float] = None
+        # Set while one health check is probing; the others reuse the
+        # previous result instead of queueing for their own connection
+        self.refreshing = False
+
+
+_health_cache = _HealthCache()
+
+
+async def _check_database() -> tuple[bool, Optional[str]]:
+    """
+    Report database connectivity, probing at most once per HEALTH_CACHE_TTL.
+
+    Returns:
+        Tuple of (database reachable, error message if not)
+    """
+    cache = _health_cache
+    if cache.checked_at is not None and (
+        cache.refreshing or time.monotonic() - cache.checked_at < HEALTH_CACHE_TTL
+    ):
+        return cache.ok, cache.error
+
+    cache.refreshing = True
+    try:
+        # Try to get a database session using lazy initialization
+        from app.core.database import get_session_factory
+
+        factory = get_session_factory()
+        async with factory() as db:
+            # Simple query to verify database connection
+            await db.execute(_SELECT_ONE)
+    except Exception as e:
+        logger.warning(f"Health check: database unavailable - {e}")
+        now = time.monotonic()
+        cache.checked_at = now
+        # Keep reporting a recent success rather than flapping on one failure
+        if cache.last_ok_at is None or now - cache.last_ok_at > HEALTH_STALE_FOR:
+            cache.ok, cache.error = False, str(e)
+    else:
+        cache.checked_at = cache.last_ok_at = time.monotonic()
+        cache.ok, cache.error = True, None
+    finally:
+        cache.refreshing = False
+
+    return cache.ok, cache.error
+
+
 @app.get("/health", tags=["health"])
 async def health_check():
     """
@@ -85,41 +201,29 @@ async def health_check():
 
     Implements graceful degradation - returns 200 OK even if database is
     unavailable, allowing the service to be monitored during outages.
+    The database probe result is cached for HEALTH_CACHE_TTL seconds, so
+    frequent probes don't each take a pooled connection.
 
     Returns:
-        JSONResponse: Health status with database connectivity check
+        Response: Health status with database connectivity check
 
     Status Codes:
         200: System is running (database connected or degraded)
     """
-    from sqlalchemy import text
-    from fastapi.responses import JSONResponse
-    from datetime import datetime
+    # Check database connectivity (optional - don't crash if unavailable)
+    database_ok, database_error = await _check_database()
+    if database_ok:
+        body = _HEALTHY_PREFIX + b',"timestamp":"' + _utc_timestamp().encode() + b'"}'
+        return Response(content=body, media_type="application/json")
 
+    # Database is unavailable, but service is still running
     health_status = {
-        "status": "healthy",
-        "version": settings.APP_VERSION,
-        "environment": settings.ENVIRONMENT,
-        "database": "unknown",
-        "timestamp": datetime.utcnow().isoformat()
+        **_HEALTH_BASE,
+        "timestamp": _utc_timestamp(),
+        "database": "disconnected",
+        "status": "degraded",  # Not "unhealthy" - service is running!
+        "database_error": database_error,
     }
 
-    # Check database connectivity (optional - don't crash if unavailable)
-    try:
-        # Try to get a database session using lazy initialization
-        from app.core.database import get_session_factory
-
-        factory = get_session_factory()
-        async with factory() as db:
-            # Simple query to verify database connection
-            await db.execute(text("SELECT 1"))
-            health_status["database"] = "connected"
-    except Exception as e:
-        # Database is unavailable, but service is still running
-        health_status["database"] = "disconnected"
-        health_status["status"] = "degraded"  # Not "unhealthy" - service is running!
-        health_status["database_error"] = str(e)
-        logger.warning(f"Health check: database unavailable - {e}")
-
     # Always return 200 - the service is running, even if degraded
-    return JSONResponse(content=health_status, status_code=200)
+    return ORJSONResponse(content=health_status, status_code=200)
@@ -1,7 +1,9 @@
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Optional, List, Dict, Any
-from datetime import datetime
-import json
+from typing import Optional, List, Dict, Any, Tuple
+import re
+import time
+import orjson
 from pydantic import BaseModel, Field, field_validator
 
 class ProgressStage(str, Enum):
@@ -12,25 +14,53 @@ class ProgressStage(str, Enum):
     COMPLETE = "complete"
     ERROR = "error"
 
+# Formatting characters stripped from phone numbers before counting digits
+_PHONE_FORMATTING = re.compile(r"[+\-() ]")
+
+# An '@' whose domain part (after the last '@') contains a '.'
+_EMAIL_DOMAIN_DOT = re.compile(r"@[^@]*\.[^@]*\Z")
+
+# (100 ms tick, ISO string) for the most recent progress timestamp
+_timestamp_cache: Tuple[int, str] = (0, "")
+
+
+def _utc_timestamp() -> str:
+    """
+    Return the current UTC time as an ISO 8601 string with tenths of a second.
+
+    The formatted string is reused within each 100 ms tick, since a parse
+    emits bursts of updates and clients only display them to the second;
+    it is formatted to the tick's precision so it never claims more.
+    """
+    global _timestamp_cache
+    tick = int(time.time() * 10)
+    if tick != _timestamp_cache[0]:
+        seconds, tenths = divmod(tick, 10)
+        _timestamp_cache = (
+            tick,
+            time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds)) + f".{tenths}",
+        )
+    return _timestamp_cache[1]
+
+
+@dataclass(slots=True)
 class ProgressUpdate:
     """Structured progress update message"""
 
-    def __init__(
-        self,
-        resume_id: str,
-        stage: ProgressStage,
-        progress: int,  # 0-100
-        status: str,
-        estimated_seconds_remaining: Optional[int] = None,
-        data: Optional[dict] = None
-    ):
-        self.resume_id = resume_id
-        self.stage = stage
-        self.progress = max(0, min(100, progress))  # Clamp to 0-100
-        self.status = status
-        self.estimated_seconds_remaining = estimated_seconds_remaining
-        self.data = data or {}
-        self.timestamp = datetime.utcnow().isoformat()
+    resume_id: str
+    stage: ProgressStage
+    progress: int  # 0-100
+    status: str
+    estimated_seconds_remaining: Optional[int] = None
+    data: Optional[dict] = None
+    timestamp: str = field(init=False)
+
+    def __post_init__(self) -> None:
+        # Clamp to 0-100; inline comparisons avoid two builtin calls
+        progress = self.progress
+        self.progress = 0 if progress < 0 else 100 if progress > 100 else progress
+        self.data = self.data or {}
+        self.timestamp = _utc_timestamp()
 
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization"""
@@ -47,31 +77,31 @@ class ProgressUpdate:
 
     def to_json(self) -> str:
         """Convert to JSON string"""
-        return json.dumps(self.to_dict())
+        return orjson.dumps(self.to_dict()).decode()
 
-class CompleteProgress(ProgressUpdate):
+def complete_progress(resume_id: str, parsed_data: dict) -> ProgressUpdate:
     """Progress update for parsing completion"""
-
-    def __init__(self, resume_id: str, parsed_data: dict):
-        super().__init__(
-            resume_id=resume_id,
-            stage=ProgressStage.COMPLETE,
-            progress=100,
-            status="Parsing complete!",
-            data=parsed_data
-        )
-
-class ErrorProgress(ProgressUpdate):
+    return ProgressUpdate(
+        resume_id=resume_id,
+        stage=ProgressStage.COMPLETE,
+        progress=100,
+        status="Parsing complete!",
+        data=parsed_data
+    )
+
+def error_progress(
+    resume_id: str,
+    error_message: str,
+    error_code: str = "PARSE_ERROR"
+) -> ProgressUpdate:
     """Progress update for parsing errors"""
-
-    def __init__(self, resume_id: str, error_message: str, error_code: str = "PARSE_ERROR"):
-        super().__init__(
-            resume_id=resume_id,
-            stage=ProgressStage.ERROR,
-            progress=0,
-            status=f"Error: {error_message}",
-            data={"error_code": error_code, "error_message": error_message}
-        )
+    return ProgressUpdate(
+        resume_id=resume_id,
+        stage=ProgressStage.ERROR,
+        progress=0,
+        status=f"Error: {error_message}",
+        data={"error_code": error_code, "error_message": error_message}
+    )
 
 
 class ParsedData(BaseModel):
@@ -126,8 +156,8 @@ class ParsedData(BaseModel):
         """Validate phone number format"""
         if v is None:
             return None
-        # Remove common formatting
-        cleaned = v.replace('+', '').replace('-', '').replace(' ', '').replace('(', '').replace(')', '')
+        # Remove common formatting in a single pass
+        cleaned = _PHONE_FORMATTING.sub('', v)
         if cleaned and len(cleaned) >= 10:
             return v
         return None
@@ -138,6 +168,6 @@ class ParsedData(BaseModel):
         """Validate email format"""
         if v is None:
             return None
-        if '@' in v and '.' in v.split('@')[-1]:
+        if _EMAIL_DOMAIN_DOT.search(v):
             return v.lower()
         return None
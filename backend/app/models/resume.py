@@ -1,9 +1,9 @@
 from sqlalchemy import Column, String, Integer, DateTime, Numeric, Boolean
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.sql import func
-import uuid
 
 from app.core.database import Base
+from app.core.ids import uuid7
 
 
 class Resume(Base):
@@ -14,7 +14,7 @@ class Resume(Base):
     """
     __tablename__ = "resumes"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     original_filename = Column(String(255), nullable=False)
     file_type = Column(String(20), nullable=False)
     file_size_bytes = Column(Integer, nullable=False)
@@ -38,7 +38,7 @@ class ParsedResumeData(Base):
     """
     __tablename__ = "parsed_resume_data"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=func.gen_random_uuid())
     resume_id = Column(UUID(as_uuid=True), nullable=False)
     personal_info = Column(JSONB, nullable=False)
     work_experience = Column(JSONB, default=list)
@@ -58,7 +58,7 @@ class ResumeCorrection(Base):
     """
     __tablename__ = "resume_corrections"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=func.gen_random_uuid())
     resume_id = Column(UUID(as_uuid=True), nullable=False)
     field_path = Column(String(100), nullable=False)
     original_value = Column(JSONB, nullable=False)
@@ -74,7 +74,7 @@ class ResumeShare(Base):
     """
     __tablename__ = "resume_shares"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=func.gen_random_uuid())
     resume_id = Column(UUID(as_uuid=True), nullable=False)
     share_token = Column(String(64), unique=True, nullable=False)
     access_count = Column(Integer, default=0)
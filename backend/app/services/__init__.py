@@ -2,26 +2,39 @@
 Services module for ResuMate.
 
 This module contains business logic services for resume processing.
+
+Exports are resolved lazily on first access, so importing a light service
+module (e.g. app.services.access_counter) doesn't also load spaCy, OpenAI
+and the PDF/DOCX parsers through this package's __init__.
 """
 
-from app.services.text_extractor import extract_text, TextExtractionError
-from app.services.nlp_extractor import extract_entities, NLPEntityExtractionError
-from app.services.parser_orchestrator import ParserOrchestrator
-from app.services.ocr_extractor import extract_text_with_ocr, OCRExtractionError, OCRNotAvailableError
-from app.services.ai_extractor import enhance_with_ai, extract_skills_with_ai, AIEnhancementError
-from app.services.database_storage import DatabaseStorageService
+import importlib
+from typing import Any
+
+# Exported name -> submodule defining it
+_EXPORTS = {
+    "extract_text": "text_extractor",
+    "TextExtractionError": "text_extractor",
+    "extract_entities": "nlp_extractor",
+    "NLPEntityExtractionError": "nlp_extractor",
+    "ParserOrchestrator": "parser_orchestrator",
+    "extract_text_with_ocr": "ocr_extractor",
+    "OCRExtractionError": "ocr_extractor",
+    "OCRNotAvailableError": "ocr_extractor",
+    "enhance_with_ai": "ai_extractor",
+    "extract_skills_with_ai": "ai_extractor",
+    "AIEnhancementError": "ai_extractor",
+    "DatabaseStorageService": "database_storage",
+}
+
+__all__ = list(_EXPORTS)
+
 
-__all__ = [
-    "extract_text",
-    "TextExtractionError",
-    "extract_entities",
-    "NLPEntityExtractionError",
-    "ParserOrchestrator",
-    "extract_text_with_ocr",
-    "OCRExtractionError",
-    "OCRNotAvailableError",
-    "enhance_with_ai",
-    "extract_skills_with_ai",
-    "AIEnhancementError",
-    "DatabaseStorageService",
-]
+def __getattr__(name: str) -> Any:
+    """Import the submodule defining an exported name on first access."""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = value
+    return value
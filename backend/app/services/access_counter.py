@@ -0,0 +1,108 @@
+"""
+Batched share access counting.
+
+Public share views are the hottest read path; writing access_count on
+every view turns each read into a database write. Views are counted in
+memory instead and flushed as a single UPDATE covering every pending
+share, either once enough views accumulate or once the flush interval
+has passed.
+
+Flushes are triggered from request handlers (as background tasks) rather
+than a long-running timer, since serverless runtimes freeze the process
+between invocations and never fire startup events.
+"""
+
+import logging
+import time
+from collections import Counter
+from typing import Dict
+
+logger = logging.getLogger(__name__)
+
+
+class AccessCounter:
+    """
+    In-memory accumulator for share access counts.
+
+    Usage:
+        if access_counter.record(share_token):
+            background_tasks.add_task(access_counter.flush)
+    """
+
+    def __init__(self, flush_interval: float = 5.0, flush_threshold: int = 100) -> None:
+        """
+        Initialize the access counter.
+
+        Args:
+            flush_interval: Seconds after which pending counts are due for flushing
+            flush_threshold: Number of pending views that triggers a flush
+        """
+        self._flush_interval = flush_interval
+        self._flush_threshold = flush_threshold
+        self._pending: Counter = Counter()
+        self._total = 0
+        self._last_flush = time.monotonic()
+
+    def record(self, share_token: str) -> bool:
+        """
+        Count one access to a share.
+
+        Args:
+            share_token: The share token that was accessed
+
+        Returns:
+            True if pending counts are due to be flushed
+        """
+        self._pending[share_token] += 1
+        self._total += 1
+        return (
+            self._total >= self._flush_threshold
+            or time.monotonic() - self._last_flush >= self._flush_interval
+        )
+
+    def pending(self, share_token: str) -> int:
+        """
+        Return the number of accesses not yet written for a share.
+
+        Args:
+            share_token: The share token to look up
+        """
+        return self._pending.get(share_token, 0)
+
+    def drain(self) -> Dict[str, int]:
+        """
+        Take all pending counts, resetting the accumulator.
+
+        Returns:
+            dict: Pending access counts keyed by share token
+        """
+        snapshot = dict(self._pending)
+        self._pending.clear()
+        self._total = 0
+        self._last_flush = time.monotonic()
+        return snapshot
+
+    async def flush(self) -> None:
+        """
+        Write pending access counts to the database in a single UPDATE.
+
+        Counts that fail to write are put back so a later flush retries them.
+        """
+        from app.core.database import db_manager
+        from app.services.database_share_storage import increment_access_many
+
+        snapshot = self.drain()
+        if not snapshot:
+            return
+
+        try:
+            async with db_manager.get_session() as db:
+                await increment_access_many(snapshot, db)
+        except Exception as e:
+            logger.error(f"Failed to flush share access counts: {e}", exc_info=True)
+            self._pending.update(snapshot)
+            self._total += sum(snapshot.values())
+
+
+# Global access counter instance
+access_counter = AccessCounter()
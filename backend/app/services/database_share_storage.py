@@ -8,13 +8,14 @@ This replaces the in-memory share_storage.py to ensure shares persist
 across server restarts and can be accessed from multiple instances.
 """
 
-from typing import Optional, Dict
-from datetime import datetime, timedelta, timezone
+from typing import Iterable, Optional, Dict, Tuple
+from datetime import datetime, timedelta
+import time
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update
+from sqlalchemy import case, select, update
 from uuid import UUID
 
-from app.models.resume import ResumeShare
+from app.models.resume import ParsedResumeData, ResumeShare
 
 
 async def create_share(
@@ -81,23 +82,87 @@ async def get_share(share_token: str, db: AsyncSession) -> Optional[dict]:
     if not share:
         return None
 
+    return _share_to_dict(share)
+
+
+async def get_shares(
+    share_tokens: Iterable[str],
+    db: AsyncSession
+) -> Dict[str, Optional[dict]]:
+    """
+    Retrieve metadata for many shares in one query.
+
+    Args:
+        share_tokens: The share tokens to look up
+        db: Async database session
+
+    Returns:
+        Dictionary mapping each requested token to its share metadata,
+        or to None if not found
+    """
+    shares: Dict[str, Optional[dict]] = dict.fromkeys(share_tokens)
+    if not shares:
+        return shares
+
+    result = await db.execute(
+        select(ResumeShare).where(ResumeShare.share_token.in_(list(shares)))
+    )
+    for share in result.scalars():
+        shares[share.share_token] = _share_to_dict(share)
+    return shares
+
+
+async def get_share_with_parsed_resume(
+    share_token: str,
+    db: AsyncSession
+) -> Tuple[Optional[dict], Optional[ParsedResumeData]]:
+    """
+    Retrieve share metadata and the shared resume's parsed data in one query.
+
+    Args:
+        share_token: The share token to look up
+        db: Async database session
+
+    Returns:
+        Tuple of (share metadata dictionary, ParsedResumeData row); the share
+        is None if not found, the row is None if the resume has no parsed data
+    """
+    result = await db.execute(
+        select(ResumeShare, ParsedResumeData)
+        .outerjoin(ParsedResumeData, ParsedResumeData.resume_id == ResumeShare.resume_id)
+        .where(ResumeShare.share_token == share_token)
+        .limit(1)
+    )
+    row = result.first()
+
+    if not row:
+        return None, None
+
+    share, parsed_resume = row
+    return _share_to_dict(share), parsed_resume
+
+
+def _share_to_dict(share: ResumeShare) -> dict:
+    """Convert a ResumeShare row to a share metadata dictionary."""
     return {
         "share_token": share.share_token,
         "resume_id": str(share.resume_id),
         "created_at": share.created_at.isoformat(),
         "expires_at": share.expires_at.isoformat(),
+        "expires_at_epoch": share.expires_at.timestamp(),
         "access_count": share.access_count,
         "is_active": share.is_active
     }
 
 
-async def increment_access(share_token: str, db: AsyncSession) -> bool:
+async def increment_access(share_token: str, db: AsyncSession, amount: int = 1) -> bool:
     """
     Increment the access count for a share in database.
 
     Args:
         share_token: The share token to update
         db: Async database session
+        amount: Number of accesses to add (default: 1)
 
     Returns:
         True if incremented successfully, False if share not found
@@ -105,7 +170,7 @@ async def increment_access(share_token: str, db: AsyncSession) -> bool:
     result = await db.execute(
         update(ResumeShare)
         .where(ResumeShare.share_token == share_token)
-        .values(access_count=ResumeShare.access_count + 1)
+        .values(access_count=ResumeShare.access_count + amount)
     )
 
     await db.commit()
@@ -114,6 +179,34 @@ async def increment_access(share_token: str, db: AsyncSession) -> bool:
     return result.rowcount > 0
 
 
+async def increment_access_many(counts: Dict[str, int], db: AsyncSession) -> int:
+    """
+    Add access counts to many shares in a single UPDATE.
+
+    Args:
+        counts: Number of accesses to add, keyed by share token
+        db: Async database session
+
+    Returns:
+        Number of shares updated
+    """
+    if not counts:
+        return 0
+
+    result = await db.execute(
+        update(ResumeShare)
+        .where(ResumeShare.share_token.in_(list(counts)))
+        .values(
+            access_count=ResumeShare.access_count
+            + case(counts, value=ResumeShare.share_token, else_=0)
+        )
+    )
+
+    await db.commit()
+
+    return result.rowcount
+
+
 async def revoke_share(share_token: str, db: AsyncSession) -> bool:
     """
     Revoke a share link by deactivating it in database.
@@ -149,19 +242,75 @@ async def is_share_valid(share_token: str, db: AsyncSession) -> bool:
         True if share is active and not expired, False otherwise
     """
     share = await get_share(share_token, db)
-    if not share:
-        return False
+    return bool(share) and share["is_active"] and time.time() <= share["expires_at_epoch"]
 
-    # Check if active
-    if not share["is_active"]:
-        return False
 
-    # Check expiration
-    expires_at = datetime.fromisoformat(share["expires_at"])
-    if datetime.now(timezone.utc) > expires_at:
-        return False
+async def get_share_by_resume_id(resume_id: str, db: AsyncSession) -> Optional[dict]:
+    """
+    Retrieve the newest active share for a resume from database.
+
+    Returns the full share metadata in one query, so callers don't need to
+    look up the token first and then fetch the share by token.
+
+    Args:
+        resume_id: The resume ID to find the share for
+        db: Async database session
+
+    Returns:
+        Share metadata dictionary, or None if the resume has no active share
+    """
+    try:
+        resume_uuid = UUID(resume_id) if isinstance(resume_id, str) else resume_id
+    except ValueError:
+        resume_uuid = resume_id
+
+    result = await db.execute(
+        select(ResumeShare)
+        .where(ResumeShare.resume_id == resume_uuid)
+        .where(ResumeShare.is_active == True)
+        .order_by(ResumeShare.created_at.desc())
+        .limit(1)
+    )
+
+    share = result.scalar_one_or_none()
+    return _share_to_dict(share) if share else None
+
+
+async def revoke_share_by_resume_id(resume_id: str, db: AsyncSession) -> Optional[str]:
+    """
+    Revoke the newest active share for a resume in a single statement.
+
+    Args:
+        resume_id: The resume ID whose share should be revoked
+        db: Async database session
+
+    Returns:
+        The revoked share token, or None if the resume has no active share
+    """
+    try:
+        resume_uuid = UUID(resume_id) if isinstance(resume_id, str) else resume_id
+    except ValueError:
+        resume_uuid = resume_id
+
+    newest_active = (
+        select(ResumeShare.share_token)
+        .where(ResumeShare.resume_id == resume_uuid)
+        .where(ResumeShare.is_active == True)
+        .order_by(ResumeShare.created_at.desc())
+        .limit(1)
+        .scalar_subquery()
+    )
+    result = await db.execute(
+        update(ResumeShare)
+        .where(ResumeShare.share_token == newest_active)
+        .values(is_active=False)
+        .returning(ResumeShare.share_token)
+    )
+    share_token = result.scalar_one_or_none()
+
+    await db.commit()
 
-    return True
+    return share_token
 
 
 async def get_share_token_by_resume_id(resume_id: str, db: AsyncSession) -> Optional[str]:
@@ -18,9 +18,9 @@ import hashlib
 import secrets
 from datetime import datetime, timedelta
 from typing import Optional, List, Dict, Any
-from uuid import UUID, uuid4
+from uuid import UUID
 
-from sqlalchemy import select, and_, or_, update
+from sqlalchemy import func, select, and_, or_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import SQLAlchemyError
 
@@ -91,7 +91,8 @@ class DatabaseStorageService:
             },
         }
 
-    def _jsonb_to_parsed_data(self, jsonb_data: Dict[str, Any]) -> ParsedData:
+    @staticmethod
+    def _jsonb_to_parsed_data(jsonb_data: Dict[str, Any]) -> ParsedData:
         """
         Convert JSONB structure to ParsedData (Pydantic).
 
@@ -218,7 +219,8 @@ class DatabaseStorageService:
         """
         update_data = {
             "processing_status": status,
-            "processed_at": datetime.utcnow() if status in ["complete", "failed"] else None,
+            # Stamped by the database, like the onupdate updated_at column
+            "processed_at": func.now() if status in ["complete", "failed"] else None,
         }
 
         if confidence_score is not None:
@@ -271,7 +273,6 @@ class DatabaseStorageService:
         jsonb_data = self._parsed_data_to_jsonb(parsed_data)
 
         parsed_resume = ParsedResumeData(
-            id=uuid4(),
             resume_id=resume_id,
             personal_info=jsonb_data["personal_info"],
             work_experience=jsonb_data["work_experience"],
@@ -306,8 +307,21 @@ class DatabaseStorageService:
         if not parsed_resume:
             return None
 
+        return self.row_to_parsed_data(parsed_resume)
+
+    @staticmethod
+    def row_to_parsed_data(parsed_resume: ParsedResumeData) -> ParsedData:
+        """
+        Convert a fetched ParsedResumeData row to ParsedData.
+
+        Args:
+            parsed_resume: ParsedResumeData row, e.g. from a joined query
+
+        Returns:
+            ParsedData Pydantic model
+        """
         # Convert JSONB structure to ParsedData (flat)
-        return self._jsonb_to_parsed_data({
+        return DatabaseStorageService._jsonb_to_parsed_data({
             "personal_info": parsed_resume.personal_info,
             "work_experience": parsed_resume.work_experience,
             "education": parsed_resume.education,
@@ -330,35 +344,29 @@ class DatabaseStorageService:
         Returns:
             Updated ParsedData or None if not found
         """
-        existing = await self.db.execute(
-            select(ParsedResumeData)
+        # Convert ParsedData to JSONB and write it in a single UPDATE,
+        # rather than loading the row and flushing attribute changes
+        jsonb_data = self._parsed_data_to_jsonb(parsed_data)
+
+        result = await self.db.execute(
+            update(ParsedResumeData)
             .where(ParsedResumeData.resume_id == resume_id)
+            .values(
+                personal_info=jsonb_data["personal_info"],
+                work_experience=jsonb_data["work_experience"],
+                education=jsonb_data["education"],
+                skills=jsonb_data["skills"],
+                confidence_scores=jsonb_data["confidence_scores"],
+            )
         )
-        existing_obj = existing.scalar_one_or_none()
 
-        if not existing_obj:
+        if result.rowcount == 0:
             return None
 
-        # Convert ParsedData to JSONB and update
-        jsonb_data = self._parsed_data_to_jsonb(parsed_data)
-
-        existing_obj.personal_info = jsonb_data["personal_info"]
-        existing_obj.work_experience = jsonb_data["work_experience"]
-        existing_obj.education = jsonb_data["education"]
-        existing_obj.skills = jsonb_data["skills"]
-        existing_obj.confidence_scores = jsonb_data["confidence_scores"]
-
         await self.db.commit()
-        await self.db.refresh(existing_obj)
-
-        # Convert back to ParsedData
-        return self._jsonb_to_parsed_data({
-            "personal_info": existing_obj.personal_info,
-            "work_experience": existing_obj.work_experience,
-            "education": existing_obj.education,
-            "skills": existing_obj.skills,
-            "confidence_scores": existing_obj.confidence_scores,
-        })
+
+        # Convert back to ParsedData from what was written
+        return self._jsonb_to_parsed_data(jsonb_data)
 
     # ========== Share Token Operations ==========
 
@@ -386,7 +394,6 @@ class DatabaseStorageService:
         expires_at = datetime.utcnow() + timedelta(days=expires_in_days) if expires_in_days else None
 
         share = ResumeShare(
-            id=uuid4(),
             resume_id=resume_id,
             share_token=share_token,
             expires_at=expires_at,
@@ -489,7 +496,6 @@ class DatabaseStorageService:
             ResumeCorrection model instance
         """
         correction = ResumeCorrection(
-            id=uuid4(),
             resume_id=resume_id,
             field_path=field_path,
             original_value=original_value,
@@ -17,7 +17,6 @@ from pathlib import Path
 from typing import Dict, List, Any, Optional
 
 import spacy
-from spacy.cli import download
 
 # Load spaCy model lazily
 nlp: Optional[spacy.Language] = None
@@ -0,0 +1,98 @@
+"""
+Bounded worker pool for background resume parsing.
+
+Uploads enqueue parse jobs onto an asyncio.Queue drained by a fixed number
+of long-lived worker tasks, so a burst of uploads cannot spawn an unbounded
+number of concurrent parse jobs on the event loop.
+"""
+
+import asyncio
+import logging
+import os
+from typing import Any, Awaitable, Callable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class ParseQueue:
+    """
+    Fixed-size pool of workers draining a bounded job queue.
+
+    Workers are started lazily on first use in the running event loop
+    (serverless runtimes never fire startup events), and are recreated
+    if the loop changes, e.g. between TestClient sessions.
+
+    Usage:
+        parse_queue = ParseQueue(parse_resume_background)
+        if parse_queue.full():
+            ...  # reject with 503
+        await parse_queue.run(resume_id, filename, content)
+    """
+
+    def __init__(
+        self,
+        handler: Callable[..., Awaitable[Any]],
+        workers: Optional[int] = None,
+        maxsize: int = 64,
+    ) -> None:
+        """
+        Initialize the parse queue.
+
+        Args:
+            handler: Coroutine function invoked with each job's arguments
+            workers: Number of worker tasks (default: CPU count)
+            maxsize: Maximum number of jobs waiting in the queue
+        """
+        self._handler = handler
+        self._workers = workers or os.cpu_count() or 1
+        self._maxsize = maxsize
+        self._queue: Optional[asyncio.Queue] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._tasks: List[asyncio.Task] = []
+
+    def _ensure_started(self) -> asyncio.Queue:
+        """Create the queue and spawn workers for the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._queue is None or self._loop is not loop:
+            self._loop = loop
+            self._queue = asyncio.Queue(maxsize=self._maxsize)
+            self._tasks = [
+                loop.create_task(self._worker(self._queue))
+                for _ in range(self._workers)
+            ]
+        return self._queue
+
+    async def _worker(self, queue: asyncio.Queue) -> None:
+        """Run queued jobs one at a time, resolving each job's future."""
+        while True:
+            args, done = await queue.get()
+            try:
+                await self._handler(*args)
+            except Exception as e:
+                logger.error(f"Parse worker job failed: {e}", exc_info=True)
+            finally:
+                if not done.done():
+                    done.set_result(None)
+                queue.task_done()
+
+    def full(self) -> bool:
+        """Return True if no more jobs can be queued without waiting."""
+        if self._queue is None or self._loop is not asyncio.get_running_loop():
+            return False
+        return self._queue.full()
+
+    async def run(self, *args: Any) -> None:
+        """
+        Enqueue a job and wait until a worker has finished it.
+
+        Waiting keeps the caller (a BackgroundTask) alive for the job's
+        duration, which serverless adapters such as Mangum rely on to
+        keep the invocation running until parsing completes.
+
+        Args:
+            *args: Arguments passed to the handler
+        """
+        queue = self._ensure_started()
+        done = asyncio.get_running_loop().create_future()
+        await queue.put((args, done))
+        await done
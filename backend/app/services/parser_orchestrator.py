@@ -22,13 +22,52 @@ from app.services.ai_extractor import enhance_with_ai
 from app.models.progress import (
     ProgressUpdate,
     ProgressStage,
-    CompleteProgress,
-    ErrorProgress
+    complete_progress,
+    error_progress
 )
 from app.core.storage import save_parsed_resume
 from app.core.config import settings
 
 
+# Readers waiting for a resume's parsed data to be committed: {resume_id: Event}
+_ready_events: Dict[str, asyncio.Event] = {}
+
+
+def notify_parsed_data_ready(resume_id: str) -> None:
+    """
+    Wake any readers waiting for this resume's parsed data.
+
+    Called after the parsed data has been committed to storage.
+
+    Args:
+        resume_id: Unique identifier for the resume
+    """
+    event = _ready_events.pop(resume_id, None)
+    if event is not None:
+        event.set()
+
+
+async def wait_for_parsed_data(resume_id: str, timeout: float) -> bool:
+    """
+    Wait until the parsed data for a resume has been committed.
+
+    Args:
+        resume_id: Unique identifier for the resume
+        timeout: Maximum number of seconds to wait
+
+    Returns:
+        True if notified before the timeout, False otherwise
+    """
+    event = _ready_events.setdefault(resume_id, asyncio.Event())
+    try:
+        await asyncio.wait_for(event.wait(), timeout=timeout)
+        return True
+    except asyncio.TimeoutError:
+        if _ready_events.get(resume_id) is event:
+            del _ready_events[resume_id]
+        return False
+
+
 def _serialize_for_websocket(data: Any) -> Any:
     """
     Recursively convert complex types to JSON-serializable formats.
@@ -144,6 +183,7 @@ class ParserOrchestrator:
                 async with AsyncSessionLocal() as db:
                     adapter = StorageAdapter(db)
                     await adapter.save_parsed_data(resume_id, parsed_data, ai_enhanced=enable_ai)
+                notify_parsed_data_ready(resume_id)
             else:
                 # Save to in-memory storage
                 save_parsed_resume(resume_id, parsed_data)
@@ -347,7 +387,7 @@ class ParserOrchestrator:
         # Serialize complex objects to JSON-compatible types
         serializable_data = _serialize_for_websocket(parsed_data)
 
-        update = CompleteProgress(resume_id=resume_id, parsed_data=serializable_data)
+        update = complete_progress(resume_id=resume_id, parsed_data=serializable_data)
         await self.websocket_manager.broadcast_to_resume(
             update.to_dict(), resume_id
         )
@@ -366,7 +406,7 @@ class ParserOrchestrator:
             error_message: Human-readable error message
             error_code: Machine-readable error code
         """
-        update = ErrorProgress(
+        update = error_progress(
             resume_id=resume_id,
             error_message=error_message,
             error_code=error_code
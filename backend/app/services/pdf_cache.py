@@ -0,0 +1,60 @@
+"""
+Cache for rendered resume PDFs.
+
+PDF rendering with ReportLab is CPU-heavy while the underlying resume data
+rarely changes between exports. Rendered bytes are cached per process,
+keyed by resume_id and a hash of the exact data rendered, so an edited
+resume never serves a stale PDF and needs no explicit invalidation.
+"""
+
+import hashlib
+from typing import Any, Dict, Tuple
+
+import orjson
+from cachetools import TTLCache
+from starlette.concurrency import run_in_threadpool
+
+from app.services.export_service import generate_pdf
+
+# Rendered PDFs by (resume_id, data hash)
+_pdf_cache: TTLCache = TTLCache(maxsize=64, ttl=3600)
+
+
+def content_key(resume_data: Dict[str, Any]) -> str:
+    """
+    Hash the canonical JSON form of the resume data.
+
+    Also serves as the PDF export's ETag, since the rendered PDF is a pure
+    function of this data.
+    """
+    canonical = orjson.dumps(resume_data, option=orjson.OPT_SORT_KEYS)
+    return hashlib.sha256(canonical).hexdigest()
+
+
+async def get_or_render(resume_id: str, resume_data: Dict[str, Any]) -> bytes:
+    """
+    Return the PDF for this resume data, rendering it only on a cache miss.
+
+    Rendering is synchronous and CPU-bound, so it runs in the threadpool
+    to keep the event loop serving other requests.
+
+    Args:
+        resume_id: Unique identifier for the resume
+        resume_data: Parsed resume data to render
+
+    Returns:
+        PDF file content as bytes
+    """
+    key: Tuple[str, str] = (resume_id, content_key(resume_data))
+    pdf_bytes = _pdf_cache.get(key)
+    if pdf_bytes is None:
+        pdf_bytes = await run_in_threadpool(generate_pdf, resume_data)
+        _pdf_cache[key] = pdf_bytes
+    return pdf_bytes
+
+
+def clear_pdf_cache() -> None:
+    """
+    Clear all cached PDFs (for testing).
+    """
+    _pdf_cache.clear()
@@ -7,7 +7,7 @@ This adapter routes storage operations to either:
 
 This provides a clean migration path with feature flag safety.
 """
-from typing import Optional, Dict, Any
+from typing import TYPE_CHECKING, Optional, Dict, Any
 from uuid import UUID
 import logging
 
@@ -22,6 +22,9 @@ from app.core.storage import (
     update_parsed_resume as update_in_memory,
 )
 
+if TYPE_CHECKING:
+    from app.models.resume import ParsedResumeData
+
 logger = logging.getLogger(__name__)
 
 
@@ -223,7 +226,8 @@ class StorageAdapter:
             # Use in-memory storage
             save_in_memory(resume_id, parsed_data)
 
-    def _parsed_data_to_nested_dict(self, parsed_data: 'ParsedData') -> Dict[str, Any]:
+    @staticmethod
+    def _parsed_data_to_nested_dict(parsed_data: 'ParsedData') -> Dict[str, Any]:
         """
         Convert ParsedData (flat Pydantic model) to nested dict format expected by frontend.
 
@@ -283,6 +287,24 @@ class StorageAdapter:
             "confidence_scores": confidence_scores,
         }
 
+    @staticmethod
+    def parsed_row_to_dict(parsed_resume: 'ParsedResumeData') -> Dict[str, Any]:
+        """
+        Convert an already-fetched ParsedResumeData row to the nested dict format.
+
+        Lets callers that fetched the row through a joined query reuse the
+        same conversion as get_parsed_data. Needs no session, so it is
+        called on the class rather than on a per-request adapter.
+
+        Args:
+            parsed_resume: ParsedResumeData row
+
+        Returns:
+            Nested dictionary matching frontend expectations
+        """
+        parsed_data = DatabaseStorageService.row_to_parsed_data(parsed_resume)
+        return StorageAdapter._parsed_data_to_nested_dict(parsed_data)
+
     async def get_parsed_data(self, resume_id: str) -> Optional[Dict[str, Any]]:
         """
         Retrieve parsed resume data.
@@ -34,6 +34,26 @@ def test_export_pdf_returns_binary_pdf():
     assert response.content[:4] == b"%PDF"
 
 
+def test_export_pdf_conditional_request_returns_304():
+    """Test that a PDF export with a matching If-None-Match returns 304"""
+    from app.core.storage import save_parsed_resume
+    resume_id = "test-resume-pdf-etag"
+    save_parsed_resume(resume_id, {
+        "personal_info": {"full_name": "PDF ETag"},
+        "work_experience": [],
+        "education": [],
+        "skills": {},
+        "confidence_scores": {}
+    })
+    response = client.get(f"/v1/resumes/{resume_id}/export/pdf")
+    etag = response.headers["etag"]
+    assert int(response.headers["content-length"]) == len(response.content)
+
+    cached = client.get(f"/v1/resumes/{resume_id}/export/pdf", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+
+
 def test_export_whatsapp_generates_url():
     """Test that WhatsApp export generates valid URL"""
     from app.core.storage import save_parsed_resume
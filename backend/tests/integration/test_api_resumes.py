@@ -66,6 +66,30 @@ def test_upload_unsupported_file_type_returns_400():
     assert "detail" in data
 
 
+def test_upload_mime_extension_mismatch_returns_400():
+    """
+    Test that a file whose extension does not match its MIME type is rejected.
+
+    GIVEN: A .pdf file declared as text/plain
+    WHEN: The file is uploaded to /v1/resumes/upload
+    THEN: The response should be 400 with a mismatch error message
+    """
+    try:
+        from app.main import app
+    except ImportError:
+        pytest.skip("app.main not implemented yet")
+
+    client = TestClient(app)
+
+    response = client.post(
+        "/v1/resumes/upload",
+        files={"file": ("resume.pdf", b"plain text content", "text/plain")}
+    )
+
+    assert response.status_code == 400
+    assert "does not match" in response.json()["detail"]
+
+
 def test_upload_file_too_large_returns_400():
     """
     Test that files larger than 10MB return 400 Bad Request.
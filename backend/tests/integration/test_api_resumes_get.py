@@ -99,6 +99,23 @@ def test_update_resume_not_found_returns_404():
     assert response.status_code == 404
 
 
+def test_update_resume_invalid_body_returns_422():
+    """Test that PUT /resumes/{id} rejects fields of the wrong type"""
+    save_parsed_resume("test-resume-invalid", {
+        "personal_info": {},
+        "work_experience": [],
+        "education": [],
+        "skills": {},
+        "confidence_scores": {}
+    })
+
+    response = client.put(
+        "/v1/resumes/test-resume-invalid",
+        json={"work_experience": "not a list"}
+    )
+    assert response.status_code == 422
+
+
 def test_update_work_experience():
     """Test updating work experience array"""
     # Setup
@@ -172,6 +172,35 @@ def test_public_share_access_returns_resume_data():
     assert data["personal_info"]["full_name"] == "Public User"
 
 
+def test_public_share_conditional_request_returns_304():
+    """Test that public share responses carry an ETag honoured by If-None-Match"""
+    from app.core.storage import save_parsed_resume
+    from app.core.share_storage import clear_all_shares
+
+    clear_all_shares()
+    resume_id = "test-resume-etag"
+    save_parsed_resume(resume_id, {
+        "personal_info": {"full_name": "ETag User"},
+        "work_experience": [],
+        "education": [],
+        "skills": {},
+        "confidence_scores": {}
+    })
+
+    create_response = client.post(f"/v1/resumes/{resume_id}/share")
+    share_token = create_response.json()["share_token"]
+
+    response = client.get(f"/v1/share/{share_token}")
+    etag = response.headers["etag"]
+    assert "max-age=60" in response.headers["cache-control"]
+
+    cached = client.get(f"/v1/share/{share_token}", headers={"If-None-Match": etag})
+
+    assert cached.status_code == 304
+    assert cached.content == b""
+    assert cached.headers["etag"] == etag
+
+
 def test_expired_share_returns_410():
     """Test that expired share returns 410 Gone"""
     from app.core.storage import save_parsed_resume
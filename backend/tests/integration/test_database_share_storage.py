@@ -16,8 +16,13 @@ from app.services.database_share_storage import (
     increment_access,
     revoke_share,
     is_share_valid,
+    get_share_with_parsed_resume,
+    get_share_by_resume_id,
+    revoke_share_by_resume_id,
+    get_shares,
+    increment_access_many,
 )
-from app.models.resume import ResumeShare
+from app.models.resume import ParsedResumeData, ResumeShare
 
 
 @pytest.mark.asyncio
@@ -88,6 +93,22 @@ async def test_increment_access_persists_to_database(db_session: AsyncSession):
     assert share_from_db.access_count == 1
 
 
+@pytest.mark.asyncio
+async def test_increment_access_many_updates_each_share(db_session: AsyncSession):
+    """Test that increment_access_many adds each share's own count in one call"""
+    resume_id = "ecfd221a-5e8b-4fbe-82d0-4f9b2ace58ce"
+    token_a = (await create_share(resume_id, db_session))["share_token"]
+    token_b = (await create_share(resume_id, db_session))["share_token"]
+
+    updated = await increment_access_many({token_a: 3, token_b: 1}, db_session)
+
+    assert updated == 2
+    shares = await get_shares([token_a, token_b, "missing-token"], db_session)
+    assert shares[token_a]["access_count"] == 3
+    assert shares[token_b]["access_count"] == 1
+    assert shares["missing-token"] is None
+
+
 @pytest.mark.asyncio
 async def test_revoke_share_persists_to_database(db_session: AsyncSession):
     """Test that revoke_share persists deactivation to database"""
@@ -159,3 +180,58 @@ async def test_share_persists_across_sessions(db_session: AsyncSession):
     # This should NOT return None (regression test for in-memory storage bug)
     assert retrieved_share is not None
     assert retrieved_share["share_token"] == share_token
+
+
+@pytest.mark.asyncio
+async def test_get_share_with_parsed_resume_joins_resume_data(db_session: AsyncSession):
+    """Test that share metadata and parsed data are returned from one lookup"""
+    resume_id = "5b0f5a64-4f0e-4c1e-9a53-0d8b8f6f2c11"
+    db_session.add(ParsedResumeData(
+        resume_id=resume_id,
+        personal_info={"full_name": "Joined Lookup"},
+        confidence_scores={"overall": 90},
+    ))
+    await db_session.commit()
+    share_data = await create_share(resume_id, db_session)
+
+    share, parsed_resume = await get_share_with_parsed_resume(
+        share_data["share_token"], db_session
+    )
+
+    assert share["resume_id"] == resume_id
+    assert share["share_token"] == share_data["share_token"]
+    assert parsed_resume.personal_info["full_name"] == "Joined Lookup"
+
+
+@pytest.mark.asyncio
+async def test_get_share_with_parsed_resume_missing_share(db_session: AsyncSession):
+    """Test that an unknown token returns no share and no data"""
+    share, parsed_resume = await get_share_with_parsed_resume("missing-token", db_session)
+
+    assert share is None
+    assert parsed_resume is None
+
+
+@pytest.mark.asyncio
+async def test_get_share_by_resume_id_returns_share(db_session: AsyncSession):
+    """Test that a resume's active share is fetched in one lookup"""
+    resume_id = "0e8c8f43-9d3a-4a57-8f0b-3f1d8f3f6a21"
+    share_data = await create_share(resume_id, db_session)
+
+    share = await get_share_by_resume_id(resume_id, db_session)
+
+    assert share["share_token"] == share_data["share_token"]
+    assert share["is_active"] is True
+
+
+@pytest.mark.asyncio
+async def test_revoke_share_by_resume_id_returns_revoked_token(db_session: AsyncSession):
+    """Test that revoking by resume ID deactivates the share in one statement"""
+    resume_id = "7a1d3c52-2b8e-4f4c-a6a9-9c2e5b7d1e40"
+    share_data = await create_share(resume_id, db_session)
+
+    revoked_token = await revoke_share_by_resume_id(resume_id, db_session)
+
+    assert revoked_token == share_data["share_token"]
+    assert await get_share_by_resume_id(resume_id, db_session) is None
+    assert await revoke_share_by_resume_id(resume_id, db_session) is None
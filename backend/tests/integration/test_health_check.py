@@ -5,6 +5,8 @@ These tests validate that the health check endpoint returns
 proper system status including database connectivity.
 """
 
+import time
+
 import pytest
 from fastapi.testclient import TestClient
 from app.main import app
@@ -62,3 +64,54 @@ def test_health_check_includes_version():
 
     # Version should be included even if database is disconnected
     assert "version" in data
+
+
+def test_health_check_reuses_recent_database_probe(monkeypatch):
+    """Test that probes within the cache TTL don't query the database again"""
+    import app.core.database as database
+    import app.main as main
+
+    probes = []
+
+    class _Session:
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc_info):
+            return False
+
+        async def execute(self, statement):
+            probes.append(statement)
+
+    monkeypatch.setattr(main, "_health_cache", main._HealthCache())
+    monkeypatch.setattr(database, "get_session_factory", lambda: _Session)
+
+    first = client.get("/health").json()
+    second = client.get("/health").json()
+
+    assert len(probes) == 1
+    assert first["database"] == second["database"] == "connected"
+
+
+def test_health_check_reports_recent_success_during_brief_outage(monkeypatch):
+    """Test that a failure right after a successful probe stays connected"""
+    import app.core.database as database
+    import app.main as main
+
+    cache = main._HealthCache()
+    monkeypatch.setattr(main, "_health_cache", cache)
+
+    def _unavailable():
+        raise ConnectionError("database unavailable")
+
+    monkeypatch.setattr(database, "get_session_factory", _unavailable)
+
+    # Fresh failure with no earlier success is reported
+    assert client.get("/health").json()["database"] == "disconnected"
+
+    # Failure shortly after a success is masked until HEALTH_STALE_FOR passes
+    now = time.monotonic()
+    cache.checked_at = now - main.HEALTH_CACHE_TTL
+    cache.last_ok_at = now - main.HEALTH_CACHE_TTL
+    cache.ok, cache.error = True, None
+    assert client.get("/health").json()["database"] == "connected"
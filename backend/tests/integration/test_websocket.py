@@ -35,6 +35,19 @@ def test_websocket_ping_pong():
         assert response["message"] == "alive"
 
 
+def test_websocket_binary_ping_gets_binary_pong():
+    """Test that a binary ping is answered with a binary pong"""
+    with client.websocket_connect("/ws/resumes/test-resume-id-binary") as websocket:
+        data = websocket.receive_json()
+        assert data["type"] == "connection_established"
+
+        websocket.send_bytes(b"ping")
+
+        response = websocket.receive_json(mode="binary")
+        assert response["type"] == "pong"
+        assert response["message"] == "alive"
+
+
 def test_websocket_disconnect():
     """Test WebSocket disconnection handling"""
     with client.websocket_connect("/ws/resumes/test-resume-id-3") as websocket:
@@ -173,6 +173,28 @@ class TestWebSocketConnectionCleanup:
         finally:
             settings.USE_DATABASE = original_use_db
 
+    def test_collected_connection_is_dropped(self):
+        """
+        Test that a connection garbage collected without disconnect() running
+        is removed from the registry rather than kept alive by it.
+        """
+        import gc
+        from unittest.mock import AsyncMock, MagicMock
+        from app.api.websocket import ConnectionManager
+
+        local_manager = ConnectionManager()
+        websocket = MagicMock()
+        websocket.accept = AsyncMock()
+        websocket.send_json = AsyncMock()
+
+        asyncio.run(local_manager.connect(websocket, "resume-1"))
+        assert len(local_manager.active_connections["resume-1"]) == 1
+
+        del websocket
+        gc.collect()
+
+        assert "resume-1" not in local_manager.active_connections
+
 
 @pytest.fixture
 def sample_resume_txt():
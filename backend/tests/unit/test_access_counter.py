@@ -0,0 +1,38 @@
+"""
+Unit tests for batched share access counting.
+"""
+
+from app.services.access_counter import AccessCounter
+
+
+def test_record_accumulates_pending_counts():
+    """Test that accesses are counted per share token until drained"""
+    counter = AccessCounter(flush_interval=60, flush_threshold=100)
+
+    counter.record("token-a")
+    counter.record("token-a")
+    counter.record("token-b")
+
+    assert counter.pending("token-a") == 2
+    assert counter.pending("token-b") == 1
+    assert counter.drain() == {"token-a": 2, "token-b": 1}
+    assert counter.pending("token-a") == 0
+
+
+def test_record_signals_flush_at_threshold():
+    """Test that record reports a flush is due once the threshold is reached"""
+    counter = AccessCounter(flush_interval=60, flush_threshold=3)
+
+    assert counter.record("token") is False
+    assert counter.record("token") is False
+    assert counter.record("token") is True
+
+    counter.drain()
+    assert counter.record("token") is False
+
+
+def test_record_signals_flush_after_interval():
+    """Test that record reports a flush is due once the interval has passed"""
+    counter = AccessCounter(flush_interval=0, flush_threshold=100)
+
+    assert counter.record("token") is True
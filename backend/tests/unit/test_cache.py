@@ -0,0 +1,71 @@
+"""
+Unit tests for in-process read caches.
+"""
+
+from app.core.cache import (
+    cache_parsed_resume,
+    cache_share,
+    cache_share_response,
+    clear_caches,
+    get_cached_parsed_resume,
+    get_cached_share,
+    get_cached_share_response,
+    invalidate_parsed_resume,
+    invalidate_share,
+)
+
+
+def test_cached_parsed_resume_round_trip():
+    """Test that cached parsed data is returned until invalidated"""
+    clear_caches()
+    data = {"personal_info": {"full_name": "Cache Test"}}
+
+    assert get_cached_parsed_resume("resume-cache") is None
+    cache_parsed_resume("resume-cache", data)
+    assert get_cached_parsed_resume("resume-cache") is data
+
+    invalidate_parsed_resume("resume-cache")
+    assert get_cached_parsed_resume("resume-cache") is None
+
+
+def test_invalidate_missing_entry_is_noop():
+    """Test that invalidating an uncached resume does not raise"""
+    clear_caches()
+    invalidate_parsed_resume("never-cached")
+
+
+def test_cached_share_round_trip():
+    """Test that cached share metadata is returned until invalidated"""
+    clear_caches()
+    share = {"share_token": "token-cache", "is_active": True}
+
+    assert get_cached_share("token-cache") is None
+    cache_share("token-cache", share)
+    assert get_cached_share("token-cache") is share
+
+    invalidate_share("token-cache")
+    assert get_cached_share("token-cache") is None
+
+
+def test_cached_share_response_tracks_parsed_resume():
+    """Test that a cached share body goes stale when the resume data changes"""
+    clear_caches()
+    data = {"personal_info": {"full_name": "Share Body"}}
+    cache_parsed_resume("resume-body", data)
+    cache_share_response("token-body", data, b"{}")
+
+    assert get_cached_share_response("token-body", "resume-body") == b"{}"
+
+    invalidate_parsed_resume("resume-body")
+    assert get_cached_share_response("token-body", "resume-body") is None
+
+
+def test_invalidate_share_drops_share_response():
+    """Test that revoking a share drops its cached body"""
+    clear_caches()
+    data = {"personal_info": {}}
+    cache_parsed_resume("resume-revoked", data)
+    cache_share_response("token-revoked", data, b"{}")
+
+    invalidate_share("token-revoked")
+    assert get_cached_share_response("token-revoked", "resume-revoked") is None
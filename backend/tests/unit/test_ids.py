@@ -0,0 +1,32 @@
+"""
+Unit tests for time-ordered identifier generation.
+"""
+
+import uuid
+
+from app.core.ids import uuid7
+
+
+def test_uuid7_sets_version_and_variant():
+    """Test that uuid7 produces an RFC 9562 version 7 UUID"""
+    value = uuid7()
+    assert isinstance(value, uuid.UUID)
+    assert value.version == 7
+    assert value.variant == uuid.RFC_4122
+    assert len(str(value)) == 36
+
+
+def test_uuid7_is_time_ordered():
+    """Test that UUIDs generated later sort after earlier ones"""
+    import time
+
+    first = uuid7()
+    time.sleep(0.002)
+    second = uuid7()
+    assert first < second
+
+
+def test_uuid7_is_unique():
+    """Test that uuid7 does not repeat within the same millisecond"""
+    values = {uuid7() for _ in range(1000)}
+    assert len(values) == 1000
@@ -0,0 +1,36 @@
+"""
+Unit tests for non-blocking logging setup.
+"""
+
+import logging
+import logging.handlers
+
+from app.core import logging_config
+
+
+def test_configure_logging_installs_queue_handler(monkeypatch):
+    """Test that an unconfigured root logger gets a QueueHandler and listener"""
+    root = logging.getLogger()
+    monkeypatch.setattr(root, "handlers", [])
+    monkeypatch.setattr(logging_config, "_listener", None)
+
+    logging_config.configure_logging()
+    try:
+        assert len(root.handlers) == 1
+        assert isinstance(root.handlers[0], logging.handlers.QueueHandler)
+        assert logging_config._listener is not None
+    finally:
+        logging_config._stop_listener()
+
+
+def test_configure_logging_keeps_existing_handlers(monkeypatch):
+    """Test that handlers configured elsewhere are left in place"""
+    root = logging.getLogger()
+    existing = logging.NullHandler()
+    monkeypatch.setattr(root, "handlers", [existing])
+    monkeypatch.setattr(logging_config, "_listener", None)
+
+    logging_config.configure_logging()
+
+    assert root.handlers == [existing]
+    assert logging_config._listener is None
@@ -0,0 +1,84 @@
+"""
+Unit tests for the bounded parse worker pool.
+"""
+
+import asyncio
+
+import pytest
+
+from app.services.parse_queue import ParseQueue
+
+
+@pytest.mark.asyncio
+async def test_run_waits_for_job_completion():
+    """Test that run() returns only after the handler has finished"""
+    processed = []
+
+    async def handler(value):
+        await asyncio.sleep(0.01)
+        processed.append(value)
+
+    queue = ParseQueue(handler, workers=2)
+    await asyncio.gather(*(queue.run(i) for i in range(5)))
+
+    assert sorted(processed) == [0, 1, 2, 3, 4]
+
+
+@pytest.mark.asyncio
+async def test_concurrency_is_bounded_by_worker_count():
+    """Test that no more than `workers` jobs run at the same time"""
+    running = 0
+    peak = 0
+
+    async def handler(_):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+
+    queue = ParseQueue(handler, workers=2)
+    await asyncio.gather(*(queue.run(i) for i in range(6)))
+
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_handler_errors_do_not_stop_workers():
+    """Test that a failing job is logged and the worker keeps going"""
+    processed = []
+
+    async def handler(value):
+        if value == "bad":
+            raise ValueError("boom")
+        processed.append(value)
+
+    queue = ParseQueue(handler, workers=1)
+    await queue.run("bad")
+    await queue.run("good")
+
+    assert processed == ["good"]
+
+
+@pytest.mark.asyncio
+async def test_full_reports_backpressure():
+    """Test that full() is True once the queue holds maxsize jobs"""
+    release = asyncio.Event()
+
+    async def handler(_):
+        await release.wait()
+
+    queue = ParseQueue(handler, workers=1, maxsize=1)
+    assert queue.full() is False
+
+    first = asyncio.create_task(queue.run(1))   # picked up by the worker
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    second = asyncio.create_task(queue.run(2))  # waits in the queue
+    await asyncio.sleep(0)
+
+    assert queue.full() is True
+
+    release.set()
+    await asyncio.gather(first, second)
+    assert queue.full() is False
@@ -157,3 +157,28 @@ async def test_orchestrator_sends_progress_during_nlp_parsing():
 
     # Should have at least one nlp_parsing update
     assert len(nlp_calls) >= 1
+
+
+@pytest.mark.asyncio
+async def test_wait_for_parsed_data_wakes_on_notify():
+    """Test that a waiting reader is woken when parsed data is committed"""
+    import asyncio
+    from app.services.parser_orchestrator import (
+        notify_parsed_data_ready,
+        wait_for_parsed_data,
+    )
+
+    waiter = asyncio.create_task(wait_for_parsed_data("ready-resume", timeout=1.0))
+    await asyncio.sleep(0)
+    notify_parsed_data_ready("ready-resume")
+
+    assert await waiter is True
+
+
+@pytest.mark.asyncio
+async def test_wait_for_parsed_data_times_out():
+    """Test that waiting without a notification times out and cleans up"""
+    from app.services.parser_orchestrator import _ready_events, wait_for_parsed_data
+
+    assert await wait_for_parsed_data("slow-resume", timeout=0.01) is False
+    assert "slow-resume" not in _ready_events
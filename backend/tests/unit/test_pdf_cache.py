@@ -0,0 +1,36 @@
+"""
+Unit tests for the rendered PDF cache.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from app.services.pdf_cache import clear_pdf_cache, get_or_render
+
+
+@pytest.mark.asyncio
+async def test_get_or_render_reuses_pdf_for_same_data():
+    """Test that identical resume data is rendered only once"""
+    clear_pdf_cache()
+    data = {"personal_info": {"full_name": "PDF Cache"}, "skills": {"technical": ["Python"]}}
+
+    with patch("app.services.pdf_cache.generate_pdf", return_value=b"%PDF-1") as render:
+        first = await get_or_render("resume-pdf", data)
+        second = await get_or_render("resume-pdf", dict(reversed(list(data.items()))))
+
+    assert first == second == b"%PDF-1"
+    render.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_get_or_render_rerenders_when_data_changes():
+    """Test that edited resume data produces a fresh render"""
+    clear_pdf_cache()
+
+    with patch("app.services.pdf_cache.generate_pdf", side_effect=[b"%PDF-1", b"%PDF-2"]) as render:
+        first = await get_or_render("resume-pdf", {"personal_info": {"full_name": "Before"}})
+        second = await get_or_render("resume-pdf", {"personal_info": {"full_name": "After"}})
+
+    assert (first, second) == (b"%PDF-1", b"%PDF-2")
+    assert render.call_count == 2
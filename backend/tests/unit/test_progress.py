@@ -31,3 +31,33 @@ def test_progress_update_to_dict():
     assert data["progress"] == 75
     assert data["status"] == "Analyzing resume structure..."
     assert "timestamp" in data
+
+def test_progress_update_clamps_progress():
+    """Test that progress outside 0-100 is clamped"""
+    low = ProgressUpdate("test-123", ProgressStage.NLP_PARSING, -5, "Parsing...")
+    high = ProgressUpdate("test-123", ProgressStage.NLP_PARSING, 150, "Parsing...")
+
+    assert low.progress == 0
+    assert high.progress == 100
+
+def test_complete_and_error_progress_build_progress_updates():
+    """Test the completion and error helpers"""
+    from app.models.progress import complete_progress, error_progress
+
+    complete = complete_progress(resume_id="test-123", parsed_data={"skills": []})
+    error = error_progress(resume_id="test-123", error_message="Bad file")
+
+    assert complete.stage == ProgressStage.COMPLETE
+    assert complete.progress == 100
+    assert error.stage == ProgressStage.ERROR
+    assert error.data == {"error_code": "PARSE_ERROR", "error_message": "Bad file"}
+    assert not hasattr(complete, "__dict__")
+
+def test_parsed_data_validates_email_and_phone():
+    """Test email and phone normalization on ParsedData"""
+    from app.models.progress import ParsedData
+
+    assert ParsedData(email="John@Example.com").email == "john@example.com"
+    assert ParsedData(email="john@localhost").email is None
+    assert ParsedData(phone="+1 (555) 123-4567").phone == "+1 (555) 123-4567"
+    assert ParsedData(phone="555-1234").phone is None
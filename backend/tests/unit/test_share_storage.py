@@ -3,13 +3,16 @@ Unit tests for share storage service.
 """
 
 import pytest
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from app.core.share_storage import (
     create_share,
     get_share,
     increment_access,
     revoke_share,
-    is_share_valid
+    is_share_valid,
+    get_share_token_by_resume_id,
+    get_share_by_resume_id,
+    get_shares,
 )
 
 
@@ -35,6 +38,14 @@ def test_create_share_sets_expiration_correctly():
     assert abs((expires_at - expected_expires).total_seconds()) < 60
 
 
+def test_create_share_precomputes_expiry_epoch():
+    """Test that the stored expiry epoch matches the ISO expiry (as UTC)"""
+    share_token = create_share("resume-epoch", expires_in_days=7)["share_token"]
+    share = get_share(share_token)
+    expires_at = datetime.fromisoformat(share["expires_at"]).replace(tzinfo=timezone.utc)
+    assert share["expires_at_epoch"] == expires_at.timestamp()
+
+
 def test_get_share_returns_metadata():
     """Test that get_share returns share metadata"""
     resume_id = "resume-123"
@@ -94,3 +105,41 @@ def test_is_share_valid_checks_expiration():
     created_share = create_share(resume_id, expires_in_days=-1)
     share_token = created_share["share_token"]
     assert is_share_valid(share_token) is False
+
+
+def test_get_share_token_by_resume_id_returns_newest_active_token():
+    """Test that the reverse index returns the latest share for a resume"""
+    resume_id = "resume-lookup"
+    create_share(resume_id, expires_in_days=7)
+    newest = create_share(resume_id, expires_in_days=7)
+    assert get_share_token_by_resume_id(resume_id) == newest["share_token"]
+    assert get_share_token_by_resume_id("resume-without-share") is None
+
+
+def test_revoke_share_removes_reverse_index_entry():
+    """Test that a revoked share is no longer found by resume_id"""
+    resume_id = "resume-lookup-revoke"
+    share_token = create_share(resume_id, expires_in_days=7)["share_token"]
+    revoke_share(share_token)
+    assert get_share_token_by_resume_id(resume_id) is None
+
+
+def test_get_share_by_resume_id_returns_active_share():
+    """Test that a resume's active share metadata is returned directly"""
+    share_data = create_share("resume-share-lookup")
+
+    share = get_share_by_resume_id("resume-share-lookup")
+    assert share["share_token"] == share_data["share_token"]
+
+    revoke_share(share_data["share_token"])
+    assert get_share_by_resume_id("resume-share-lookup") is None
+
+
+def test_get_shares_returns_metadata_per_token():
+    """Test that get_shares maps every requested token, None for unknown ones"""
+    share_token = create_share("resume-batch")["share_token"]
+
+    shares = get_shares([share_token, "unknown-token"])
+
+    assert shares[share_token]["resume_id"] == "resume-batch"
+    assert shares["unknown-token"] is None
@@ -0,0 +1,29 @@
+"""
+Unit tests for in-memory parsed resume storage.
+"""
+
+from cachetools import LRUCache
+
+from app.core import storage
+from app.core.storage import get_parsed_resume, save_parsed_resume, update_parsed_resume
+
+
+def test_least_recently_used_resume_is_evicted(monkeypatch):
+    """Test that the store stays bounded, evicting the least recently used resume"""
+    monkeypatch.setattr(storage, "_resume_store", LRUCache(maxsize=2))
+
+    save_parsed_resume("resume-1", {"n": 1})
+    save_parsed_resume("resume-2", {"n": 2})
+    get_parsed_resume("resume-1")  # resume-2 is now least recently used
+    save_parsed_resume("resume-3", {"n": 3})
+
+    assert get_parsed_resume("resume-1") == {"n": 1}
+    assert get_parsed_resume("resume-2") is None
+    assert get_parsed_resume("resume-3") == {"n": 3}
+
+
+def test_update_missing_resume_returns_false(monkeypatch):
+    """Test that updating an unknown resume reports failure"""
+    monkeypatch.setattr(storage, "_resume_store", LRUCache(maxsize=2))
+
+    assert update_parsed_resume("missing", {"n": 1}) is False
@@ -0,0 +1,64 @@
+"""
+Unit tests for WebSocket progress broadcast coalescing.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import orjson
+import pytest
+from starlette.websockets import WebSocketState
+
+from app.api.websocket import ConnectionManager, PROGRESS_COALESCE_WINDOW
+
+
+@pytest.fixture
+def websocket():
+    """Connected WebSocket mock"""
+    ws = MagicMock()
+    ws.accept = AsyncMock()
+    ws.send_json = AsyncMock()
+    ws.send_text = AsyncMock()
+    ws.client_state = WebSocketState.CONNECTED
+    ws.application_state = WebSocketState.CONNECTED
+    return ws
+
+
+def _progress(stage: str, progress: int) -> dict:
+    return {"type": "progress_update", "stage": stage, "progress": progress}
+
+
+def _sent(ws) -> list:
+    return [orjson.loads(call.args[0]) for call in ws.send_text.call_args_list]
+
+
+@pytest.mark.asyncio
+async def test_progress_burst_sends_latest_only(websocket):
+    """Test that progress updates within the window collapse into one frame"""
+    manager = ConnectionManager()
+    await manager.connect(websocket, "resume-1")
+
+    await manager.broadcast_to_resume(_progress("text_extraction", 10), "resume-1")
+    await manager.broadcast_to_resume(_progress("text_extraction", 20), "resume-1")
+    await manager.broadcast_to_resume(_progress("nlp_parsing", 40), "resume-1")
+    assert websocket.send_text.await_count == 0
+
+    await asyncio.sleep(PROGRESS_COALESCE_WINDOW * 2)
+
+    assert _sent(websocket) == [_progress("nlp_parsing", 40)]
+
+
+@pytest.mark.asyncio
+async def test_status_change_sends_immediately_and_drops_pending(websocket):
+    """Test that a complete update goes out at once and supersedes queued progress"""
+    manager = ConnectionManager()
+    await manager.connect(websocket, "resume-1")
+
+    await manager.broadcast_to_resume(_progress("nlp_parsing", 40), "resume-1")
+    await manager.broadcast_to_resume(_progress("complete", 100), "resume-1")
+
+    assert _sent(websocket) == [_progress("complete", 100)]
+
+    await asyncio.sleep(PROGRESS_COALESCE_WINDOW * 2)
+
+    assert _sent(websocket) == [_progress("complete", 100)]